@@ -20,8 +20,15 @@ Ref:
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
-
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from src.input.cookie_patterns import (  # noqa: F401 — DEFAULT_* re-exported
+    DEFAULT_SESSION_COOKIE_PATTERNS,
+    session_cookie_matcher,
+)
 from src.input.models import (
     AnalysisResult,
     AuthMechanism,
@@ -35,20 +42,49 @@ from src.input.models import (
 logger = logging.getLogger(__name__)
 
 # Default auth headers — matches settings.yaml auth_detection.custom_headers
-DEFAULT_AUTH_HEADERS: List[str] = [
+DEFAULT_AUTH_HEADERS: Tuple[str, ...] = (
     "Authorization",
     "X-API-Key",
     "X-Auth-Token",
     "Api-Key",
     "X-Access-Token",
-]
+)
+
+# Normalized defaults, computed once so the per-exchange scans never redo them
+_DEFAULT_AUTH_HEADER_NAMES: Dict[str, str] = {h.lower(): h for h in DEFAULT_AUTH_HEADERS}
+_DEFAULT_AUTH_HEADERS_LC: FrozenSet[str] = frozenset(_DEFAULT_AUTH_HEADER_NAMES)
+
+
+@lru_cache(maxsize=32)
+def _normalize_auth_headers(auth_headers: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercase custom auth header names into a set, memoized per tuple.
+
+    ``detect_auth_mechanism`` runs once per flow with the same settings,
+    so the set is built once per distinct header list rather than per call.
+    """
+    return frozenset(h.lower() for h in auth_headers)
 
-# Default session cookie patterns — matches settings.yaml
-DEFAULT_SESSION_COOKIE_PATTERNS: List[str] = ["session", "sid", "auth"]
 
 # Short-circuit score — matches settings.yaml scoring.short_circuit_score
 SHORT_CIRCUIT_SCORE: int = 5
 
+# Placeholder exchange for CSRF-011 findings on empty flows. HttpExchange is
+# frozen and its mappings are read-only views, so one shared instance can
+# serve every such finding without a consumer's edit leaking into the others.
+_EMPTY_MAPPING: Mapping[str, str] = MappingProxyType({})
+_EMPTY_EXCHANGE = HttpExchange(
+    request_method="GET",
+    request_url="unknown",
+    request_headers=_EMPTY_MAPPING,  # type: ignore[arg-type]
+    request_cookies=_EMPTY_MAPPING,  # type: ignore[arg-type]
+    request_body=None,
+    request_content_type="",
+    response_status=0,
+    response_headers=_EMPTY_MAPPING,  # type: ignore[arg-type]
+    response_body=None,
+    timestamp=datetime.min,
+)
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -77,17 +113,25 @@ def detect_auth_mechanism(
 
     Ref: FR-106, coding_standards.instructions.md §1.3
     """
-    patterns = cookie_patterns or DEFAULT_SESSION_COOKIE_PATTERNS
-    headers = auth_headers or DEFAULT_AUTH_HEADERS
+    cookie_re = session_cookie_matcher(cookie_patterns)
+    auth_headers_lc = (
+        _normalize_auth_headers(tuple(auth_headers)) if auth_headers else _DEFAULT_AUTH_HEADERS_LC
+    )
+    search_cookie = cookie_re.search
 
     has_cookies = False
     has_auth_headers = False
 
+    # Single pass: each exchange's cookies and headers are inspected inline,
+    # skipping whichever category has already been found
     for exchange in flow.exchanges:
         if not has_cookies:
-            has_cookies = _has_session_cookie(exchange, patterns)
+            for cookie_name in exchange.request_cookies:
+                if search_cookie(cookie_name):
+                    has_cookies = True
+                    break
         if not has_auth_headers:
-            has_auth_headers = _has_auth_header(exchange, headers)
+            has_auth_headers = not auth_headers_lc.isdisjoint(exchange.headers_lc)
         # Early exit if both found
         if has_cookies and has_auth_headers:
             break
@@ -101,13 +145,15 @@ def detect_auth_mechanism(
     else:
         mechanism = AuthMechanism.NONE
 
-    logger.debug(
-        "Flow %s: cookies=%s, auth_headers=%s → %s",
-        flow.session_id,
-        has_cookies,
-        has_auth_headers,
-        mechanism.value,
-    )
+    # Called once per flow; skip building the log call when DEBUG is off
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Flow %s: cookies=%s, auth_headers=%s → %s",
+            flow.session_id,
+            has_cookies,
+            has_auth_headers,
+            mechanism.value,
+        )
     return mechanism
 
 
@@ -130,10 +176,8 @@ def update_flow_auth(
         New SessionFlow with the detected auth_mechanism.
     """
     mechanism = detect_auth_mechanism(flow, cookie_patterns, auth_headers)
-    return SessionFlow(
-        session_id=flow.session_id,
-        exchanges=flow.exchanges,
-        auth_mechanism=mechanism,
+    return SessionFlow._make(  # type: ignore[attr-defined]
+        flow.session_id, flow.exchanges, mechanism
     )
 
 
@@ -183,47 +227,6 @@ def build_short_circuit_result(flow: SessionFlow) -> AnalysisResult:
 # ---------------------------------------------------------------------------
 
 
-def _has_session_cookie(
-    exchange: HttpExchange,
-    patterns: List[str],
-) -> bool:
-    """Check if an exchange has any session cookie.
-
-    Args:
-        exchange: The HTTP exchange to inspect.
-        patterns: Substrings to match against cookie names.
-
-    Returns:
-        True if any cookie name contains a pattern (case-insensitive).
-    """
-    for cookie_name in exchange.request_cookies:
-        cookie_lower = cookie_name.lower()
-        for pattern in patterns:
-            if pattern.lower() in cookie_lower:
-                return True
-    return False
-
-
-def _has_auth_header(
-    exchange: HttpExchange,
-    auth_headers: List[str],
-) -> bool:
-    """Check if an exchange has any auth header.
-
-    Args:
-        exchange: The HTTP exchange to inspect.
-        auth_headers: Header names to check for.
-
-    Returns:
-        True if any auth header is present (case-insensitive).
-    """
-    request_headers_lower = {k.lower(): v for k, v in exchange.request_headers.items()}
-    for header in auth_headers:
-        if header.lower() in request_headers_lower:
-            return True
-    return False
-
-
 def _build_csrf_011_finding(
     flow: SessionFlow,
     exchange: Optional[HttpExchange],
@@ -240,31 +243,20 @@ def _build_csrf_011_finding(
     # Collect evidence from auth headers
     evidence_parts: List[str] = []
     if exchange:
-        for header_name in DEFAULT_AUTH_HEADERS:
-            for req_header, req_value in exchange.request_headers.items():
-                if req_header.lower() == header_name.lower():
-                    # Truncate long values (e.g., JWT tokens)
-                    display_value = req_value[:50] + "..." if len(req_value) > 50 else req_value
-                    evidence_parts.append(f"{req_header}: {display_value}")
+        headers_lc = exchange.headers_lc
+        for header_lc, header_name in _DEFAULT_AUTH_HEADER_NAMES.items():
+            if header_lc not in headers_lc:
+                continue
+            req_value = headers_lc[header_lc]
+            # Truncate long values (e.g., JWT tokens)
+            display_value = req_value[:50] + "..." if len(req_value) > 50 else req_value
+            evidence_parts.append(f"{header_name}: {display_value}")
 
     evidence = "; ".join(evidence_parts) if evidence_parts else "Header-only auth detected"
 
-    # Create a minimal exchange if none provided
+    # Fall back to the shared placeholder if none provided
     if exchange is None:
-        from datetime import datetime
-
-        exchange = HttpExchange(
-            request_method="GET",
-            request_url="unknown",
-            request_headers={},
-            request_cookies={},
-            request_body=None,
-            request_content_type="",
-            response_status=0,
-            response_headers={},
-            response_body=None,
-            timestamp=datetime.now(),
-        )
+        exchange = _EMPTY_EXCHANGE
 
     return Finding(
         rule_id="CSRF-011",
@@ -0,0 +1,54 @@
+"""Session cookie name matching for CSRF Shield AI.
+
+Shared by the flow reconstructor (grouping exchanges by session cookie)
+and the auth detector (spotting cookie-based auth), so both compile and
+cache the same matcher.
+
+Ref:
+    - spec/Requirements.md FR-105, FR-106
+    - config/settings.yaml — auth_detection.session_cookie_patterns
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Optional, Pattern, Sequence, Tuple
+
+# Default patterns — matches settings.yaml auth_detection.session_cookie_patterns
+DEFAULT_SESSION_COOKIE_PATTERNS: Tuple[str, ...] = ("session", "sid", "auth")
+
+
+@lru_cache(maxsize=32)
+def compile_cookie_patterns(patterns: Tuple[str, ...]) -> Pattern[str]:
+    """Compile cookie-name substrings into one case-insensitive regex.
+
+    A single alternation scans each cookie name once, instead of one
+    substring test per pattern. Results are memoized so repeated calls
+    with the same custom patterns reuse the compiled regex.
+
+    Args:
+        patterns: Substrings to match against cookie names.
+
+    Returns:
+        Compiled regex; use ``.search(cookie_name)`` to test a name.
+    """
+    return re.compile("|".join(re.escape(p) for p in patterns), re.IGNORECASE)
+
+
+_DEFAULT_COOKIE_RE: Pattern[str] = compile_cookie_patterns(DEFAULT_SESSION_COOKIE_PATTERNS)
+
+
+def session_cookie_matcher(patterns: Optional[Sequence[str]] = None) -> Pattern[str]:
+    """Return the compiled matcher for ``patterns``, or the default one.
+
+    Args:
+        patterns: Substrings to match against cookie names. None or empty
+            selects ``DEFAULT_SESSION_COOKIE_PATTERNS``, compiled at import.
+
+    Returns:
+        Compiled case-insensitive regex for the patterns.
+    """
+    if not patterns:
+        return _DEFAULT_COOKIE_RE
+    return compile_cookie_patterns(tuple(patterns))
@@ -11,17 +11,22 @@ Ref:
 
 from __future__ import annotations
 
+import itertools
 import logging
-import uuid
 from collections import defaultdict
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import DefaultDict, Iterable, List, Optional, Pattern
 
+from src.input.cookie_patterns import (  # noqa: F401 — DEFAULT_* re-exported
+    DEFAULT_SESSION_COOKIE_PATTERNS,
+    session_cookie_matcher,
+)
 from src.input.models import AuthMechanism, HttpExchange, SessionFlow
 
 logger = logging.getLogger(__name__)
 
-# Default patterns — matches settings.yaml auth_detection.session_cookie_patterns
-DEFAULT_SESSION_COOKIE_PATTERNS: List[str] = ["session", "sid", "auth"]
+# Process-wide source of fallback IDs for exchanges without a session cookie
+_fallback_ids = itertools.count(1)
 
 
 # ---------------------------------------------------------------------------
@@ -30,7 +35,7 @@ DEFAULT_SESSION_COOKIE_PATTERNS: List[str] = ["session", "sid", "auth"]
 
 
 def reconstruct_flows(
-    exchanges: List[HttpExchange],
+    exchanges: Iterable[HttpExchange],
     cookie_patterns: Optional[List[str]] = None,
 ) -> List[SessionFlow]:
     """Group exchanges into SessionFlow objects by session cookie.
@@ -44,8 +49,8 @@ def reconstruct_flows(
     is deferred to Milestone 5 (T-141).
 
     Args:
-        exchanges: Flat list of HttpExchange objects (e.g., from
-            ``parse_har_file()``).
+        exchanges: HttpExchange objects in any order, as a list or a
+            single-pass iterator (e.g., from ``iter_har_file()``).
         cookie_patterns: Optional list of substrings to match against
             cookie names. Defaults to ``["session", "sid", "auth"]``.
 
@@ -53,35 +58,31 @@ def reconstruct_flows(
         List of SessionFlow objects, one per unique session ID.
         Flows are sorted by the timestamp of their first exchange.
     """
-    if not exchanges:
+    cookie_re = session_cookie_matcher(cookie_patterns)
+
+    # Sort once up front; grouping then preserves chronological order, and
+    # dict insertion order leaves flows ordered by their first exchange.
+    # Flows can only be emitted once every exchange has been seen, since a
+    # session may resume at any point in the capture.
+    ordered = sorted(exchanges, key=attrgetter("timestamp"))
+    if not ordered:
         return []
 
-    patterns = cookie_patterns or DEFAULT_SESSION_COOKIE_PATTERNS
+    # defaultdict allocates a list only for new sessions, unlike setdefault
+    groups: DefaultDict[str, List[HttpExchange]] = defaultdict(list)
+    for exchange in ordered:
+        groups[_identify_session(exchange, cookie_re)].append(exchange)
 
-    # Group exchanges by session ID
-    groups: Dict[str, List[HttpExchange]] = defaultdict(list)
-    for exchange in exchanges:
-        session_id = _identify_session(exchange, patterns)
-        groups[session_id].append(exchange)
-
-    # Build SessionFlow objects, sorting exchanges chronologically
-    flows: List[SessionFlow] = []
-    for session_id, group in groups.items():
-        sorted_exchanges = sorted(group, key=lambda e: e.timestamp)
-        flow = SessionFlow(
-            session_id=session_id,
-            exchanges=sorted_exchanges,
-            auth_mechanism=AuthMechanism.NONE,  # Set by auth detector later
-        )
-        flows.append(flow)
-
-    # Sort flows by first exchange timestamp for deterministic ordering
-    flows.sort(key=lambda f: f.exchanges[0].timestamp)
+    # Positional fast constructor; auth_mechanism is set by the auth detector later
+    make_flow = SessionFlow._make  # type: ignore[attr-defined]
+    flows = [
+        make_flow(session_id, group, AuthMechanism.NONE) for session_id, group in groups.items()
+    ]
 
     logger.info(
         "Reconstructed %d session flow(s) from %d exchange(s)",
         len(flows),
-        len(exchanges),
+        len(ordered),
     )
     return flows
 
@@ -91,31 +92,27 @@ def reconstruct_flows(
 # ---------------------------------------------------------------------------
 
 
-def _identify_session(
-    exchange: HttpExchange,
-    patterns: List[str],
-) -> str:
+def _identify_session(exchange: HttpExchange, cookie_re: Pattern[str]) -> str:
     """Identify the session ID from an exchange's cookies.
 
-    Scans ``exchange.request_cookies`` for any cookie name that contains
-    one of the given patterns (case-insensitive substring match). Returns
-    the value of the first matching cookie.
+    Scans ``exchange.request_cookies`` for any cookie name that
+    ``cookie_re`` matches (see ``session_cookie_matcher``). Returns the
+    value of the first matching cookie.
 
     If no session cookie is found, generates a unique fallback ID with a
-    ``"no-session-"`` prefix.
+    ``"no-session-"`` prefix from a process-wide counter, so each
+    sessionless exchange still forms its own flow.
 
     Args:
         exchange: The HTTP exchange to inspect.
-        patterns: List of substrings to match against cookie names.
+        cookie_re: Compiled session cookie name matcher.
 
     Returns:
         The session ID string.
     """
     for cookie_name, cookie_value in exchange.request_cookies.items():
-        cookie_name_lower = cookie_name.lower()
-        for pattern in patterns:
-            if pattern.lower() in cookie_name_lower:
-                return cookie_value
+        if cookie_re.search(cookie_name):
+            return cookie_value
 
     # No session cookie found — generate fallback
-    return f"no-session-{uuid.uuid4().hex[:8]}"
+    return f"no-session-{next(_fallback_ids):08x}"
@@ -18,17 +18,61 @@ Ref:
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
+import mmap
+import os
+import stat
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urlencode
+from sys import intern
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote_plus
 
-from src.input.models import HttpExchange
+from src.input.models import HeaderDict, HttpExchange
+
+try:
+    import orjson
+except ImportError:  # optional: faster HAR decoding
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: streaming HAR decoding
+    ijson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:  # optional: C ISO 8601 parser
+    _parse_iso8601 = None
 
 logger = logging.getLogger(__name__)
 
+# Entry count from which parsing with workers > 1 fans out over a process
+# pool; below it, process startup and pickling cost more than they save
+PARALLEL_PARSE_THRESHOLD: int = 1024
+_PARSE_CHUNK_SIZE: int = 256
+
+# Header and cookie values repeat across a capture (Host, User-Agent, the
+# session cookie), so each parse job shares one string per distinct value.
+# The pool is reset past this many values to bound it on streamed captures.
+_VALUE_POOL_LIMIT: int = 4096
+
+# Canonical method strings keyed by their usual spellings, so the common
+# case is one dict probe and all exchanges share one object per method
+_METHOD_MAP: Dict[str, str] = {
+    spelling: intern(m)
+    for m in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "CONNECT", "TRACE")
+    for spelling in (m, m.lower())
+}
+
+# Parameter names repeat across requests (csrf_token, id, ...); cache their
+# quoted form. Values are mostly unique, so they are quoted directly.
+_quote_param_name = lru_cache(maxsize=1024)(quote_plus)
+
 
 # ---------------------------------------------------------------------------
 # Custom Exception
@@ -44,11 +88,31 @@ class HarParseError(Exception):
 # ---------------------------------------------------------------------------
 
 
-def parse_har_file(path: Union[str, Path]) -> List[HttpExchange]:
+def parse_har_file(
+    path: Union[str, Path],
+    *,
+    include_response_body: bool = True,
+    workers: int = 1,
+) -> List[HttpExchange]:
     """Parse a HAR 1.2 file and return a list of HttpExchange objects.
 
+    Parsing is serial by default. With ``workers > 1``, captures of at least
+    ``PARALLEL_PARSE_THRESHOLD`` entries are parsed in chunks across a
+    ``ProcessPoolExecutor`` of that size; entry order is preserved. Workers
+    are started per call and the exchanges are pickled back, so this only
+    pays off for large captures parsed from a regular (non-worker) process.
+
+    Nothing is cached between calls: every call parses the file again and
+    returns its own exchanges, so callers never share header or cookie
+    dicts and a parsed capture is freed once the caller drops it.
+
     Args:
         path: Path to the HAR file (JSON format).
+        include_response_body: Keep ``response.content.text`` on each
+            exchange. Pass False when only request-side data is analyzed;
+            response bodies are usually most of a capture's bytes.
+        workers: Number of worker processes for large captures; 1 parses
+            in the calling process.
 
     Returns:
         List of HttpExchange instances, one per HAR entry.
@@ -58,29 +122,213 @@ def parse_har_file(path: Union[str, Path]) -> List[HttpExchange]:
         FileNotFoundError: If the file does not exist.
     """
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"HAR file not found: {path}")
-
+    _stat_har_file(path)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(path)
     except json.JSONDecodeError as e:
         raise HarParseError(f"Invalid JSON in HAR file: {e}") from e
 
+    exchanges = _parse_har_document(data, include_response_body, workers)
+    logger.info("Parsed %d exchanges from %s", len(exchanges), path.name)
+    return exchanges
+
+
+def parse_har_bytes(
+    data: Union[bytes, str],
+    *,
+    include_response_body: bool = True,
+    workers: int = 1,
+) -> List[HttpExchange]:
+    """Parse an in-memory HAR 1.2 document into HttpExchange objects.
+
+    For captures that never touch disk (proxy exports, HTTP uploads).
+    Validation and entry parsing are shared with ``parse_har_file``.
+
+    Args:
+        data: The HAR document as JSON bytes or text.
+        include_response_body: Keep ``response.content.text`` on each
+            exchange, as for ``parse_har_file``.
+        workers: Worker processes for large captures, as for
+            ``parse_har_file``.
+
+    Returns:
+        List of HttpExchange instances, one per HAR entry.
+
+    Raises:
+        HarParseError: If the data is not valid HAR 1.2.
+    """
+    try:
+        document = orjson.loads(data) if orjson is not None else json.loads(data)
+    except json.JSONDecodeError as e:
+        raise HarParseError(f"Invalid JSON in HAR data: {e}") from e
+    return _parse_har_document(document, include_response_body, workers)
+
+
+def iter_har_file(
+    path: Union[str, Path],
+    *,
+    include_response_body: bool = True,
+) -> Iterator[HttpExchange]:
+    """Stream HttpExchange objects from a HAR 1.2 file, one entry at a time.
+
+    With ijson installed, entries are decoded incrementally from
+    ``log.entries``, so only one raw entry is held in memory at a time
+    and captures larger than RAM can be processed. Without ijson this
+    falls back to ``parse_har_file``.
+
+    Structural errors are raised while iterating, once the stream shows
+    the document cannot be valid HAR.
+
+    Args:
+        path: Path to the HAR file (JSON format).
+        include_response_body: Keep ``response.content.text`` on each
+            exchange, as for ``parse_har_file``.
+
+    Returns:
+        Iterator of HttpExchange instances, one per HAR entry.
+
+    Raises:
+        HarParseError: If the file is not valid HAR 1.2.
+        FileNotFoundError: If the file does not exist.
+    """
+    path = Path(path)
+    _stat_har_file(path)
+
+    if ijson is None:
+        return iter(parse_har_file(path, include_response_body=include_response_body))
+    return _stream_har(path, include_response_body)
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+
+def _stat_har_file(path: Path) -> os.stat_result:
+    """Stat a HAR path, failing fast unless it is an existing regular file.
+
+    One ``stat`` call covers both checks, so directories and other
+    non-files are rejected before any open or decode is attempted.
+
+    Args:
+        path: Path to the HAR file.
+
+    Returns:
+        The file's stat result.
+
+    Raises:
+        FileNotFoundError: If the path does not exist or is not a file.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"HAR file not found: {path}") from None
+    if not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(f"HAR file not found (not a regular file): {path}")
+    return st
+
+
+def _parse_har_document(
+    data: Any,
+    include_response_body: bool,
+    workers: int = 1,
+) -> List[HttpExchange]:
+    """Validate a decoded HAR document and parse its entries.
+
+    With ``workers > 1``, entry lists of at least ``PARALLEL_PARSE_THRESHOLD``
+    are parsed across a process pool; entry order is preserved.
+
+    Args:
+        data: Decoded JSON document.
+        include_response_body: Keep response bodies on the exchanges.
+        workers: Worker processes to use for large entry lists.
+
+    Returns:
+        HttpExchange instances, one per parsable HAR entry.
+
+    Raises:
+        HarParseError: If the document is not valid HAR 1.2.
+    """
     _validate_har(data)
 
     entries = data["log"]["entries"]
-    exchanges: List[HttpExchange] = []
+    if workers > 1 and len(entries) >= PARALLEL_PARSE_THRESHOLD:
+        return _parse_entries_parallel(entries, workers, include_response_body)
+    return list(_parse_entries(entries, include_response_body=include_response_body))
+
+
+def _load_json(path: Path) -> Any:
+    """Decode a JSON file, using orjson over a read-only mmap if installed.
+
+    orjson decodes straight from the mapped pages, avoiding both the
+    stdlib parser and a full in-memory copy of the file. Falls back to
+    ``json.load`` when orjson is unavailable.
 
-    for i, entry in enumerate(entries):
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        The decoded JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+            (``orjson.JSONDecodeError`` is a subclass).
+    """
+    if orjson is None:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file; let orjson report it as invalid JSON
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+# Prefixes whose first event reveals the HAR skeleton while streaming
+_STREAM_SHAPE_PREFIXES = frozenset({"", "log", "log.entries", "log.version"})
+
+
+def _stream_har(path: Path, include_response_body: bool = True) -> Iterator[HttpExchange]:
+    """Incrementally parse ``log.entries`` with ijson.
+
+    Args:
+        path: Path to an existing HAR file.
+        include_response_body: Keep response bodies on the exchanges.
+
+    Yields:
+        HttpExchange instances, one per valid HAR entry.
+
+    Raises:
+        HarParseError: If the file is not valid JSON or not HAR 1.2.
+    """
+    shapes: Dict[str, Tuple[str, Any]] = {}
+    count = 0
+
+    with open(path, "rb") as f:
+        events = _record_shapes(ijson.parse(f, use_float=True), shapes)
         try:
-            exchange = _parse_entry(entry)
-            exchanges.append(exchange)
-        except (KeyError, ValueError) as e:
-            logger.warning("Skipping entry %d: %s", i, e)
+            entries = ijson.items(events, "log.entries.item")
+            for exchange in _parse_entries(entries, include_response_body=include_response_body):
+                count += 1
+                yield exchange
+        except ijson.JSONError as e:
+            raise HarParseError(f"Invalid JSON in HAR file: {e}") from e
 
-    logger.info("Parsed %d exchanges from %s", len(exchanges), path.name)
-    return exchanges
+    _validate_streamed_har(shapes)
+    logger.info("Streamed %d exchanges from %s", count, path.name)
+
+
+def _record_shapes(
+    events: Iterable[Tuple[str, str, Any]],
+    shapes: Dict[str, Tuple[str, Any]],
+) -> Iterator[Tuple[str, str, Any]]:
+    """Pass ijson events through, noting the first event of key prefixes."""
+    for prefix, event, value in events:
+        if prefix in _STREAM_SHAPE_PREFIXES and prefix not in shapes:
+            shapes[prefix] = (event, value)
+        yield prefix, event, value
 
 
 # ---------------------------------------------------------------------------
@@ -99,24 +347,56 @@ def _validate_har(data: dict) -> None:
     Raises:
         HarParseError: If required keys are missing or version is unsupported.
     """
-    if not isinstance(data, dict):
+    # Valid HARs are the common case: one lookup chain, and the specific
+    # error is only worked out once that chain has failed
+    try:
+        log = data["log"]
+        entries = log["entries"]
+    except (KeyError, TypeError, IndexError):
+        if not isinstance(data, dict):
+            raise HarParseError("HAR data must be a JSON object") from None
+        if "log" not in data:
+            raise HarParseError("Missing required 'log' key in HAR data") from None
+        if not isinstance(data["log"], dict):
+            raise HarParseError("'log' must be a JSON object") from None
+        raise HarParseError("Missing required 'entries' key in HAR log") from None
+
+    if not isinstance(entries, list):
+        raise HarParseError("'entries' must be a JSON array")
+
+    version = log.get("version", "")
+    if version and not version.startswith("1."):
+        logger.warning("HAR version %s may not be fully supported (expected 1.x)", version)
+
+
+def _validate_streamed_har(shapes: Dict[str, Tuple[str, Any]]) -> None:
+    """Validate HAR 1.2 structure from the events seen while streaming.
+
+    Mirrors ``_validate_har`` for documents that were never fully loaded.
+
+    Args:
+        shapes: First ``(event, value)`` seen at each skeleton prefix.
+
+    Raises:
+        HarParseError: If required keys are missing or have the wrong type.
+    """
+    if shapes.get("", ("",))[0] != "start_map":
         raise HarParseError("HAR data must be a JSON object")
 
-    if "log" not in data:
+    if "log" not in shapes:
         raise HarParseError("Missing required 'log' key in HAR data")
 
-    log = data["log"]
-    if not isinstance(log, dict):
+    if shapes["log"][0] != "start_map":
         raise HarParseError("'log' must be a JSON object")
 
-    if "entries" not in log:
+    if "log.entries" not in shapes:
         raise HarParseError("Missing required 'entries' key in HAR log")
 
-    if not isinstance(log["entries"], list):
+    if shapes["log.entries"][0] != "start_array":
         raise HarParseError("'entries' must be a JSON array")
 
-    version = log.get("version", "")
-    if version and not version.startswith("1."):
+    event, version = shapes.get("log.version", ("string", ""))
+    if event == "string" and version and not version.startswith("1."):
         logger.warning("HAR version %s may not be fully supported (expected 1.x)", version)
 
 
@@ -125,25 +405,112 @@ def _validate_har(data: dict) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _parse_entry(entry: dict) -> HttpExchange:
+def _parse_entries(
+    entries: Iterable[dict],
+    start: int = 0,
+    include_response_body: bool = True,
+) -> Iterator[HttpExchange]:
+    """Parse HAR entries lazily, skipping malformed ones.
+
+    Args:
+        entries: Items of har.log.entries[], in order.
+        start: Index of the first entry, used in skip warnings.
+        include_response_body: Keep response bodies on the exchanges.
+
+    Yields:
+        HttpExchange instances for each entry that parses. Entries with
+        missing fields or fields of the wrong type (e.g. a null method)
+        are logged and skipped.
+    """
+    value_pool: Dict[str, str] = {}
+    for i, entry in enumerate(entries, start):
+        if len(value_pool) > _VALUE_POOL_LIMIT:
+            value_pool.clear()
+        try:
+            yield _parse_entry(entry, include_response_body, value_pool)
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Skipping entry %d: %s", i, e)
+
+
+def _parse_entries_chunk(
+    entries: List[dict],
+    start: int,
+    include_response_body: bool,
+) -> List[HttpExchange]:
+    """Worker-side wrapper: parse one chunk of entries into a list."""
+    return list(_parse_entries(entries, start, include_response_body))
+
+
+def _parse_entries_parallel(
+    entries: List[dict],
+    workers: int,
+    include_response_body: bool = True,
+) -> List[HttpExchange]:
+    """Parse entries in fixed-size chunks across worker processes.
+
+    Each entry is independent, so chunks are parsed concurrently and
+    re-joined in their original order.
+
+    Args:
+        entries: Items of har.log.entries[].
+        workers: Size of the process pool.
+        include_response_body: Keep response bodies on the exchanges.
+
+    Returns:
+        HttpExchange instances for each entry that parses, in order.
+    """
+    starts = range(0, len(entries), _PARSE_CHUNK_SIZE)
+    chunks = [entries[i:i + _PARSE_CHUNK_SIZE] for i in starts]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        flags = itertools.repeat(include_response_body)
+        results = pool.map(_parse_entries_chunk, chunks, starts, flags)
+        return list(itertools.chain.from_iterable(results))
+
+
+def _parse_entry(
+    entry: dict,
+    include_response_body: bool = True,
+    value_pool: Optional[Dict[str, str]] = None,
+) -> HttpExchange:
     """Parse a single HAR entry into an HttpExchange.
 
     Args:
         entry: A single item from har.log.entries[].
+        include_response_body: If False, ``response_body`` is left as None
+            so large response payloads are not retained.
+        value_pool: Header/cookie values seen so far in this parse job,
+            mapped to themselves; equal values are stored as one string.
 
     Returns:
         HttpExchange instance populated from the entry data.
 
     Raises:
         KeyError: If required fields are missing from the entry.
+        TypeError: If a required field has the wrong type.
+        AttributeError: If a required field has the wrong type.
     """
     request = entry["request"]
     response = entry["response"]
-
-    # Extract headers and cookies
-    request_headers = _extract_headers(request.get("headers", []))
-    request_cookies = _extract_cookies(request.get("cookies", []))
-    response_headers = _extract_headers(response.get("headers", []))
+    if value_pool is None:
+        value_pool = {}
+    pool_value = value_pool.setdefault
+
+    # Extract headers and cookies. Cookies are a plain name → value map
+    # (``[{"name": "sid", "value": "abc123"}, ...]`` in HAR), built inline;
+    # names are interned and values pooled, as for headers. intern() and the
+    # pool only take strings, and captures do contain nulls: cookies without
+    # a string name are dropped, other values are kept as they are
+    request_headers = _extract_headers(request.get("headers", ()), value_pool)
+    request_cookies = {}
+    for item in request.get("cookies", ()):
+        name = item.get("name")
+        if name and isinstance(name, str):
+            value = item.get("value", "")
+            if isinstance(value, str):
+                value = pool_value(value, value)
+            request_cookies[intern(name)] = value
+    response_headers = _extract_headers(response.get("headers", ()), value_pool)
 
     # Extract body via postData (handles all content types + fallback)
     post_data = request.get("postData")
@@ -151,74 +518,75 @@ def _parse_entry(entry: dict) -> HttpExchange:
     request_content_type = ""
     if post_data:
         request_content_type = post_data.get("mimeType", "")
-    elif "Content-Type" in request_headers:
-        request_content_type = request_headers["Content-Type"]
-
-    # Extract response body
-    response_content = response.get("content", {})
-    response_body = response_content.get("text")
+    else:
+        request_content_type = request_headers.get("content-type", "")
+    # Content types repeat across a capture; share one string per value.
+    # A null or non-string mimeType reads as no content type
+    if isinstance(request_content_type, str):
+        request_content_type = intern(request_content_type)
+    else:
+        request_content_type = ""
+
+    # Extract response body (only when the caller will read it)
+    response_body = None
+    if include_response_body:
+        response_body = response.get("content", {}).get("text")
 
     # Parse timestamp
     timestamp = _parse_timestamp(entry.get("startedDateTime", ""))
 
-    return HttpExchange(
-        request_method=request["method"].upper(),
-        request_url=request["url"],
-        request_headers=request_headers,
-        request_cookies=request_cookies,
-        request_body=request_body,
-        request_content_type=request_content_type,
-        response_status=response["status"],
-        response_headers=response_headers,
-        response_body=response_body,
-        timestamp=timestamp,
+    method = request["method"]
+    request_method = _METHOD_MAP.get(method) or intern(method.upper())
+
+    # Positional fast constructor — skips the frozen __init__ (see models.py)
+    return HttpExchange._make(
+        request_method,
+        request["url"],
+        request_headers,
+        request_cookies,
+        request_body,
+        request_content_type,
+        response["status"],
+        response_headers,
+        response_body,
+        timestamp,
     )
 
 
 # ---------------------------------------------------------------------------
-# Header / Cookie Extraction
+# Header Extraction
 # ---------------------------------------------------------------------------
 
 
-def _extract_headers(headers_list: list) -> Dict[str, str]:
-    """Convert HAR headers array to a flat dict.
+def _extract_headers(
+    headers_list: Iterable[dict],
+    value_pool: Optional[Dict[str, str]] = None,
+) -> HeaderDict:
+    """Convert HAR headers array to a case-insensitive dict.
 
     HAR stores headers as ``[{"name": "Host", "value": "example.com"}, ...]``.
-    Duplicate header names are joined with ``, `` (RFC 7230 §3.2.2).
+    Lowercasing, interning and joining repeated names are left to
+    ``HeaderDict.from_pairs``; values are shared through ``value_pool``
+    within a parse job. Headers without a string name or value (e.g.
+    ``null``) are dropped.
 
     Args:
         headers_list: List of name/value dicts from HAR.
+        value_pool: Values seen so far, mapped to themselves.
 
     Returns:
-        Dict mapping header names to values.
+        HeaderDict mapping lowercased header names to values.
     """
-    result: Dict[str, str] = {}
-    for item in headers_list:
-        name = item.get("name", "")
-        value = item.get("value", "")
-        if name in result:
-            result[name] = f"{result[name]}, {value}"
-        else:
-            result[name] = value
-    return result
-
-
-def _extract_cookies(cookies_list: list) -> Dict[str, str]:
-    """Convert HAR cookies array to a flat dict.
+    pool_value = (value_pool if value_pool is not None else {}).setdefault
 
-    HAR stores cookies as ``[{"name": "sid", "value": "abc123"}, ...]``.
+    def pairs() -> Iterator[Tuple[str, str]]:
+        for item in headers_list:
+            name = item.get("name")
+            value = item.get("value", "")
+            if isinstance(name, str) and isinstance(value, str):
+                yield name, pool_value(value, value)
 
-    Args:
-        cookies_list: List of name/value dicts from HAR.
-
-    Returns:
-        Dict mapping cookie names to values.
-    """
-    return {
-        item.get("name", ""): item.get("value", "")
-        for item in cookies_list
-        if item.get("name")
-    }
+    return HeaderDict.from_pairs(pairs())
 
 
 # ---------------------------------------------------------------------------
@@ -268,14 +636,15 @@ def _params_fallback(params: list) -> str:
         params: List of ``{"name": ..., "value": ...}`` dicts from HAR.
 
     Returns:
-        URL-encoded string of the parameters.
+        URL-encoded string of the parameters, encoded like ``urlencode``.
     """
-    pairs = [
-        (item.get("name", ""), item.get("value", ""))
-        for item in params
-        if item.get("name") is not None
-    ]
-    return urlencode(pairs)
+    parts: List[str] = []
+    for item in params:
+        name = item.get("name")
+        if name is None:
+            continue
+        parts.append(f"{_quote_param_name(str(name))}={quote_plus(str(item.get('value', '')))}")
+    return "&".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -287,7 +656,9 @@ def _parse_timestamp(iso_str: str) -> datetime:
     """Parse an ISO 8601 timestamp from HAR's startedDateTime.
 
     HAR uses ISO 8601 format: ``2026-02-24T12:00:00.000+07:00``.
-    Falls back to ``datetime.now()`` if parsing fails.
+    Uses the ciso8601 C parser when installed (it accepts a trailing ``Z``
+    natively), otherwise ``datetime.fromisoformat``. Falls back to
+    ``datetime.now()`` if parsing fails.
 
     Args:
         iso_str: ISO 8601 timestamp string.
@@ -298,14 +669,21 @@ def _parse_timestamp(iso_str: str) -> datetime:
     if not iso_str:
         return datetime.now()
 
+    try:
+        if _parse_iso8601 is not None:
+            return _parse_iso8601(iso_str)
+        return _fromisoformat(iso_str)
+    except ValueError:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Could not parse timestamp '%s', using now()", iso_str)
+        return datetime.now()
+
+
+def _fromisoformat(iso_str: str) -> datetime:
+    """Stdlib ISO 8601 parsing, accepting a trailing ``Z`` on Python < 3.11."""
     try:
         # Python 3.11+ handles most ISO 8601 formats
         return datetime.fromisoformat(iso_str)
     except ValueError:
         # Strip trailing Z (UTC indicator not handled by fromisoformat < 3.11)
-        try:
-            cleaned = iso_str.replace("Z", "+00:00")
-            return datetime.fromisoformat(cleaned)
-        except ValueError:
-            logger.warning("Could not parse timestamp '%s', using now()", iso_str)
-            return datetime.now()
+        return datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
@@ -11,10 +11,11 @@ Ref:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from sys import intern
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 
 # ---------------------------------------------------------------------------
@@ -69,12 +70,134 @@ class AuthMechanism(str, Enum):
     NONE = "none"
 
 
+# ---------------------------------------------------------------------------
+# Header Mapping
+# ---------------------------------------------------------------------------
+
+
+# "Not seen yet" marker for HeaderDict.from_pairs; a stored value may be None
+_MISSING: Any = object()
+
+
+class HeaderDict(Dict[str, str]):
+    """Case-insensitive mapping of HTTP header names to values.
+
+    Header names are case-insensitive (RFC 7230 §3.2). Keys are stored
+    lowercased once at construction, so ``headers["Content-Type"]`` and
+    ``"content-type" in headers`` are single dict probes and rules never
+    rescan for case variants. Iteration yields the lowercased names. Every
+    dict method that adds keys (including ``|``, ``|=`` and ``fromkeys``)
+    is overridden to lowercase them and to return a ``HeaderDict``.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        headers: Union[Mapping[str, str], Iterable[Tuple[str, str]]] = (),
+    ) -> None:
+        items = headers.items() if isinstance(headers, Mapping) else headers
+        super().__init__((name.lower(), value) for name, value in items)
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, str]]) -> HeaderDict:
+        """Build from header lines in capture order, joining repeated names.
+
+        Each name is lowercased and interned once here, so case variants of
+        the same header are joined with ``, `` like other duplicates (RFC
+        7230 §3.2.2) and every instance shares one string per name. Most
+        headers appear once: they are stored directly and only repeats are
+        collected, joined once at the end so a header repeated k times costs
+        O(total length) rather than O(k²).
+
+        Args:
+            pairs: ``(name, value)`` header lines, names in any casing.
+
+        Returns:
+            HeaderDict with one entry per distinct lowercased name.
+        """
+        headers = cls()
+        # Names are lowercased here, so skip the overridden per-call .lower()
+        set_header = dict.__setitem__
+        get_header = dict.get
+        repeated: Optional[Dict[str, List[str]]] = None
+        for name, value in pairs:
+            name = intern(name.lower())
+            first = get_header(headers, name, _MISSING)
+            if first is _MISSING:
+                set_header(headers, name, value)
+            else:
+                if repeated is None:
+                    repeated = {}
+                values = repeated.get(name)
+                if values is None:
+                    repeated[name] = [first, value]
+                else:
+                    values.append(value)
+        if repeated:
+            for name, values in repeated.items():
+                set_header(headers, name, ", ".join(values))
+        return headers
+
+    def __getitem__(self, name: str) -> str:
+        return super().__getitem__(name.lower())
+
+    def __setitem__(self, name: str, value: str) -> None:
+        super().__setitem__(name.lower(), value)
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name.lower())
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and super().__contains__(name.lower())
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return super().get(name.lower(), default)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        return super().pop(name.lower(), *default)
+
+    def setdefault(self, name: str, default: str = "") -> str:
+        return super().setdefault(name.lower(), default)
+
+    def update(self, *args: Any, **kwargs: str) -> None:  # type: ignore[override]
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def copy(self) -> HeaderDict:
+        return HeaderDict(self)
+
+    @classmethod
+    def fromkeys(cls, names: Iterable[str], value: Any = None) -> HeaderDict:  # type: ignore[override]
+        return cls((name, value) for name in names)
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        result = self.copy()
+        result.update(other)
+        return result
+
+    def __ror__(self, other: Any) -> Any:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        result = HeaderDict(other)
+        result.update(self)
+        return result
+
+    def __ior__(self, other: Any) -> HeaderDict:  # type: ignore[override]
+        self.update(other)
+        return self
+
+
 # ---------------------------------------------------------------------------
 # Dataclasses — All frozen=True per coding_standards §2.4
+# slots=True drops the per-instance __dict__; one HttpExchange is built per
+# HAR entry, so this is the dominant per-object memory cost when parsing.
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HttpExchange:
     """A single HTTP request/response pair extracted from a HAR file.
 
@@ -84,12 +207,14 @@ class HttpExchange:
     Attributes:
         request_method: HTTP method (GET, POST, PUT, DELETE, PATCH).
         request_url: Full request URL including query string.
-        request_headers: Request headers as key-value pairs.
+        request_headers: Request headers as key-value pairs (a
+            ``HeaderDict`` when produced by the HAR parser).
         request_cookies: Parsed cookies from the Cookie header.
         request_body: Raw request body (None for GET requests or empty bodies).
         request_content_type: Value of the Content-Type request header.
         response_status: HTTP response status code.
-        response_headers: Response headers as key-value pairs.
+        response_headers: Response headers as key-value pairs (a
+            ``HeaderDict`` when produced by the HAR parser).
         response_body: Raw response body (None if not captured).
         timestamp: When the exchange occurred.
 
@@ -107,8 +232,62 @@ class HttpExchange:
     response_body: Optional[str]
     timestamp: datetime
 
-
-@dataclass(frozen=True)
+    @property
+    def headers_lc(self) -> Dict[str, str]:
+        """Request headers keyed by lowercased name.
+
+        Header names are case-insensitive (RFC 7230 §3.2), so detectors and
+        rules look headers up through this view. The HAR parser stores a
+        ``HeaderDict``, which is already lowercased and is returned as-is;
+        other mappings are lowercased into a new dict on each access.
+        """
+        headers = self.request_headers
+        if isinstance(headers, HeaderDict):
+            return headers
+        return {k.lower(): v for k, v in headers.items()}
+
+
+def _build_fast_constructor(cls: type) -> Any:
+    """Generate a positional constructor that writes slots directly.
+
+    A frozen dataclass ``__init__`` routes every field through
+    ``object.__setattr__``. Writing through each slot's member descriptor
+    skips that path, which adds up when the HAR parser builds one instance
+    per entry. The function is generated once at import time from
+    ``__dataclass_fields__`` so it stays in step with the field list. Also
+    used for ``SessionFlow``, which the flow reconstructor and auth detector
+    build once per flow.
+
+    Args:
+        cls: A ``slots=True`` dataclass whose fields are all init fields.
+
+    Returns:
+        A function ``(cls, *fields) -> instance``.
+
+    Raises:
+        TypeError: If ``cls`` has a non-init field, which ``_make`` would
+            leave unset.
+    """
+    names = []
+    for f in cls.__dataclass_fields__.values():
+        if not f.init:
+            raise TypeError(f"{cls.__name__}.{f.name} is not an init field")
+        names.append(f.name)
+    namespace: Dict[str, Any] = {"_new": object.__new__}
+    lines = [f"def _make(cls, {', '.join(names)}):", "    self = _new(cls)"]
+    for name in names:
+        namespace[f"_set_{name}"] = cls.__dict__[name].__set__
+        lines.append(f"    _set_{name}(self, {name})")
+    lines.append("    return self")
+    exec("\n".join(lines), namespace)  # noqa: S102 — source built from field names only
+    return namespace["_make"]
+
+
+# Internal fast path for the HAR parser; arguments follow the field order
+HttpExchange._make = classmethod(_build_fast_constructor(HttpExchange))  # type: ignore[attr-defined]
+
+
+@dataclass(frozen=True, slots=True)
 class SessionFlow:
     """An ordered sequence of exchanges belonging to one user session.
 
@@ -129,7 +308,11 @@ class SessionFlow:
     auth_mechanism: AuthMechanism
 
 
-@dataclass(frozen=True)
+# Built once per flow, and cookieless captures have one flow per exchange
+SessionFlow._make = classmethod(_build_fast_constructor(SessionFlow))  # type: ignore[attr-defined]
+
+
+@dataclass(frozen=True, slots=True)
 class Finding:
     """A single security finding produced by a static analysis rule.
 
@@ -155,7 +338,7 @@ class Finding:
     exchange: HttpExchange
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
     """Final analysis output for a single endpoint/flow.
 
@@ -18,6 +18,7 @@ import json
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add project root to sys.path so 'src.X' imports work when run directly
 project_root = Path(__file__).resolve().parent.parent
@@ -26,14 +27,13 @@ if str(project_root) not in sys.path:
 
 import click
 
-from src.input.auth_detector import (
-    build_short_circuit_result,
-    detect_auth_mechanism,
-    update_flow_auth,
-)
-from src.input.flow_reconstructor import reconstruct_flows
-from src.input.har_parser import HarParseError, parse_har_file
-from src.input.models import AuthMechanism
+# The analysis pipeline (HAR parser, optional decoders, process pool) and
+# orjson are imported inside the functions that use them, so `--help`,
+# `--version` and `train` start without loading them
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from src.input.models import AnalysisResult, AuthMechanism, SessionFlow
 
 # ---------------------------------------------------------------------------
 # Logging Setup
@@ -58,6 +58,29 @@ def _configure_logging(verbosity: str) -> None:
     logging.basicConfig(level=level, format=LOG_FORMAT)
 
 
+def _write_json_report(output_path: Path, report: dict) -> None:
+    """Write the JSON report with 2-space indentation.
+
+    Serializes with orjson in one call when installed (written as bytes
+    in a single write), otherwise with the stdlib ``json`` module.
+
+    Args:
+        output_path: Report destination; parent directories are created.
+        report: JSON-serializable report data.
+    """
+    try:
+        import orjson
+    except ImportError:  # optional: faster report serialization
+        orjson = None
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
 # ---------------------------------------------------------------------------
 # CLI Group
 # ---------------------------------------------------------------------------
@@ -115,15 +138,23 @@ def analyze(ctx: click.Context, input_file: str, output_file: str, output_format
     Runs the Phase 1 pipeline: parse → reconstruct flows → detect auth.
     Static analysis and ML scoring added in Phases 2–3.
     """
+    from src.input.auth_detector import build_short_circuit_result, update_flow_auth
+    from src.input.flow_reconstructor import reconstruct_flows
+    from src.input.har_parser import HarParseError, iter_har_file
+    from src.input.models import AuthMechanism
+
     click.echo(f"🔍 Analyzing: {input_file}")
 
     # --- Phase 1 Pipeline ---
 
-    # Step 1: Parse HAR file → List[HttpExchange]
+    # Steps 1–2: Stream HAR entries straight into flow reconstruction, so the
+    # raw HAR document and a separate exchange list are never held at once
     try:
         click.echo("📥 Parsing HAR file...")
-        exchanges = parse_har_file(Path(input_file))
-        click.echo(f"  ✓ Parsed {len(exchanges)} exchange(s)")
+        click.echo("🔗 Reconstructing session flows...")
+        # No analysis phase reads response bodies; don't keep them in memory
+        exchanges = iter_har_file(Path(input_file), include_response_body=False)
+        flows = reconstruct_flows(exchanges)
     except HarParseError as e:
         click.echo(f"❌ HAR parse error: {e}", err=True)
         sys.exit(1)
@@ -131,57 +162,27 @@ def analyze(ctx: click.Context, input_file: str, output_file: str, output_format
         click.echo(f"❌ File not found: {input_file}", err=True)
         sys.exit(1)
 
-    if not exchanges:
+    if not flows:
         click.echo("⚠️  No exchanges found in HAR file.")
         sys.exit(0)
 
-    # Step 2: Reconstruct session flows → List[SessionFlow]
-    click.echo("🔗 Reconstructing session flows...")
-    flows = reconstruct_flows(exchanges)
+    n_exchanges = sum(len(flow.exchanges) for flow in flows)
+    click.echo(f"  ✓ Parsed {n_exchanges} exchange(s)")
     click.echo(f"  ✓ Reconstructed {len(flows)} session flow(s)")
 
-    # Step 3: Detect auth mechanisms
+    # Step 3: Detect auth mechanisms and summarize each flow in one pass
     click.echo("🔐 Detecting auth mechanisms...")
-    updated_flows = [update_flow_auth(flow) for flow in flows]
-
-    results = []
-    for flow in updated_flows:
-        mechanism = flow.auth_mechanism
-        click.echo(
-            f"  Session '{flow.session_id[:20]}...' → "
-            f"{mechanism.value} ({len(flow.exchanges)} requests)"
-        )
-
-        if mechanism == AuthMechanism.HEADER_ONLY:
-            # Short-circuit: CSRF not applicable
-            result = build_short_circuit_result(flow)
-            results.append({
-                "session_id": flow.session_id,
-                "short_circuited": True,
-                "risk_score": result.risk_score,
-                "risk_level": result.risk_level.value,
-                "finding": result.findings[0].rule_id if result.findings else None,
-            })
-            click.echo(f"    ⚡ Short-circuited → score={result.risk_score} (CSRF N/A)")
-        else:
-            # TODO: Phase 2 static analysis + Phase 3 ML scoring
-            results.append({
-                "session_id": flow.session_id,
-                "short_circuited": False,
-                "auth_mechanism": mechanism.value,
-                "exchanges": len(flow.exchanges),
-                "status": "awaiting_phase2",
-            })
-            click.echo(f"    ⏳ Queued for analysis (Phase 2 not yet implemented)")
+    header_only = AuthMechanism.HEADER_ONLY
+    results = [
+        _summarize_flow(update_flow_auth(flow), header_only, build_short_circuit_result)
+        for flow in flows
+    ]
 
     # Step 4: Output results
     click.echo(f"\n📄 Output format: {output_format}")
 
     if output_format == "json":
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump({"flows": results, "total_flows": len(results)}, f, indent=2)
+        _write_json_report(Path(output_file), {"flows": results, "total_flows": len(results)})
         click.echo(f"💾 Report saved to: {output_file}")
     else:
         # TODO: HTML report generation (Phase 4)
@@ -190,6 +191,53 @@ def analyze(ctx: click.Context, input_file: str, output_file: str, output_format
     click.echo("✅ Analysis complete.")
 
 
+def _summarize_flow(
+    flow: SessionFlow,
+    header_only: AuthMechanism,
+    build_short_circuit_result: Callable[[SessionFlow], AnalysisResult],
+) -> dict:
+    """Report one auth-detected flow and build its JSON result entry.
+
+    The pipeline pieces are passed in by ``analyze``, which imports them
+    once, so the per-flow path does no imports.
+
+    Args:
+        flow: Session flow with its auth mechanism already detected.
+        header_only: ``AuthMechanism.HEADER_ONLY``, the short-circuit trigger.
+        build_short_circuit_result: Builds the CSRF-011 result for a flow.
+
+    Returns:
+        Result dict for the ``flows`` list of the report.
+    """
+    mechanism = flow.auth_mechanism
+    click.echo(
+        f"  Session '{flow.session_id[:20]}...' → "
+        f"{mechanism.value} ({len(flow.exchanges)} requests)"
+    )
+
+    if mechanism == header_only:
+        # Short-circuit: CSRF not applicable
+        result = build_short_circuit_result(flow)
+        click.echo(f"    ⚡ Short-circuited → score={result.risk_score} (CSRF N/A)")
+        return {
+            "session_id": flow.session_id,
+            "short_circuited": True,
+            "risk_score": result.risk_score,
+            "risk_level": result.risk_level.value,
+            "finding": result.findings[0].rule_id if result.findings else None,
+        }
+
+    # TODO: Phase 2 static analysis + Phase 3 ML scoring
+    click.echo(f"    ⏳ Queued for analysis (Phase 2 not yet implemented)")
+    return {
+        "session_id": flow.session_id,
+        "short_circuited": False,
+        "auth_mechanism": mechanism.value,
+        "exchanges": len(flow.exchanges),
+        "status": "awaiting_phase2",
+    }
+
+
 # ---------------------------------------------------------------------------
 # Train Subcommand (T-163)
 # ---------------------------------------------------------------------------
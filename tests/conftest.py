@@ -3,15 +3,23 @@
 Ref: .agent/instructions/testing_strategy.instructions.md §2.2
 
 Provides reusable test data objects used across unit and integration tests.
-All fixtures return real dataclass instances from src.input.models.
+All fixtures return real dataclass instances from src.input.models. The
+dataclasses are frozen, so fixtures are session-scoped and built once per
+run; tests must not mutate the dicts and lists they hold.
 """
 
 from __future__ import annotations
 
+import json
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Callable, Dict, List, Mapping, Optional
 
 import pytest
+from click.testing import CliRunner
 
+from src.input.har_parser import parse_har_bytes
 from src.input.models import (
     AnalysisResult,
     AuthMechanism,
@@ -21,9 +29,38 @@ from src.input.models import (
     SessionFlow,
     Severity,
 )
+from src.main import main
 
+SAMPLE_DIR = Path(__file__).absolute().parent.parent / "data" / "sample_har"
+_MINIMAL_HAR = str(SAMPLE_DIR / "minimal.har")
 
-@pytest.fixture
+
+# ---------------------------------------------------------------------------
+# Options — `pytest --fast` skips tests marked slow
+# ---------------------------------------------------------------------------
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register ``--fast`` for quick interactive runs."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip tests marked slow (e.g. numba JIT compilation).",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """Skip ``slow`` tests under ``--fast``; the default run keeps them."""
+    if not config.getoption("--fast"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test skipped by --fast")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
 def sample_exchange() -> HttpExchange:
     """A basic POST exchange with cookie auth and a CSRF token in the body.
 
@@ -44,7 +81,7 @@ def sample_exchange() -> HttpExchange:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_session_flow(sample_exchange: HttpExchange) -> SessionFlow:
     """A session flow containing one exchange with cookie-based auth."""
     return SessionFlow(
@@ -54,7 +91,7 @@ def sample_session_flow(sample_exchange: HttpExchange) -> SessionFlow:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bearer_exchange() -> HttpExchange:
     """An HTTP exchange using Bearer token auth (no cookies).
 
@@ -77,7 +114,7 @@ def bearer_exchange() -> HttpExchange:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bearer_session_flow(bearer_exchange: HttpExchange) -> SessionFlow:
     """A session flow using header-only auth — triggers short-circuit."""
     return SessionFlow(
@@ -87,7 +124,7 @@ def bearer_session_flow(bearer_exchange: HttpExchange) -> SessionFlow:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_finding(sample_exchange: HttpExchange) -> Finding:
     """A HIGH-severity finding for missing CSRF token (CSRF-001)."""
     return Finding(
@@ -100,7 +137,7 @@ def sample_finding(sample_exchange: HttpExchange) -> Finding:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_analysis_result(sample_finding: Finding) -> AnalysisResult:
     """A complete analysis result with ML probability (non-short-circuited)."""
     return AnalysisResult(
@@ -113,3 +150,122 @@ def sample_analysis_result(sample_finding: Finding) -> AnalysisResult:
         ml_probability=0.82,
         feature_vector={"has_csrf_token": 0, "token_entropy": 0.0},
     )
+
+
+# ---------------------------------------------------------------------------
+# Factories — for tests that need many small variations
+# ---------------------------------------------------------------------------
+
+# Shared defaults for factory-built exchanges. The empty mappings are
+# read-only views, so reusing them across exchanges cannot leak state.
+_DEFAULT_TIMESTAMP = datetime(2026, 1, 1)
+_EMPTY: Mapping[str, str] = MappingProxyType({})
+
+
+@pytest.fixture(scope="session")
+def exchange_factory() -> Callable[..., HttpExchange]:
+    """Factory for minimal exchanges: GET, no body, status 200, 2026-01-01.
+
+    Keyword arguments override the defaults: ``method``, ``url``,
+    ``headers``, ``cookies`` and ``timestamp``. Builds through the
+    parser's ``HttpExchange._make`` fast path (checked against the
+    dataclass ``__init__`` in test_models), with arguments in field order.
+    """
+
+    def make(
+        method: str = "GET",
+        url: str = "https://example.com/",
+        headers: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> HttpExchange:
+        return HttpExchange._make(  # type: ignore[attr-defined]
+            method,
+            url,
+            headers or _EMPTY,
+            cookies or _EMPTY,
+            None,
+            "",
+            200,
+            _EMPTY,
+            None,
+            timestamp or _DEFAULT_TIMESTAMP,
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def flow_factory() -> Callable[..., SessionFlow]:
+    """Factory for session flows with the NONE placeholder auth mechanism."""
+
+    def make(exchanges: List[HttpExchange], session_id: str = "test-session") -> SessionFlow:
+        return SessionFlow(
+            session_id=session_id,
+            exchanges=exchanges,
+            auth_mechanism=AuthMechanism.NONE,
+        )
+
+    return make
+
+
+# ---------------------------------------------------------------------------
+# Sample HAR Files
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def sample_har_bytes() -> Dict[str, bytes]:
+    """Raw bytes of every sample HAR, keyed by file name, read once.
+
+    For tests that parse or build captures in memory; decode a fresh copy
+    before modifying it. Tests of file loading itself still read from
+    ``SAMPLE_DIR`` so the real file paths are exercised.
+    """
+    return {path.name: path.read_bytes() for path in SAMPLE_DIR.glob("*.har")}
+
+
+@pytest.fixture(scope="session")
+def sample_exchanges(sample_har_bytes: Dict[str, bytes]) -> Dict[str, List[HttpExchange]]:
+    """Parsed exchanges of every sample HAR, keyed by file stem, parsed once.
+
+    For tests that only read fields of the parsed result; exchanges are
+    frozen, but the lists are shared, so do not modify them.
+    """
+    return {
+        name.removesuffix(".har"): parse_har_bytes(data)
+        for name, data in sample_har_bytes.items()
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI Runs — the analyze pipeline on minimal.har, run once per session
+# ---------------------------------------------------------------------------
+
+
+def _run_analyze(output: Path, *global_args: str) -> SimpleNamespace:
+    """Invoke ``analyze`` on minimal.har and collect the result and report."""
+    result = CliRunner().invoke(main, [
+        *global_args,
+        "analyze",
+        "--input", _MINIMAL_HAR,
+        "--output", str(output),
+    ])
+    data = json.loads(output.read_text(encoding="utf-8")) if output.exists() else None
+    return SimpleNamespace(result=result, output_path=output, data=data)
+
+
+@pytest.fixture(scope="session")
+def analyzed_minimal(tmp_path_factory: pytest.TempPathFactory) -> SimpleNamespace:
+    """``analyze`` run on minimal.har: ``result``, ``output_path`` and ``data``."""
+    return _run_analyze(tmp_path_factory.mktemp("cli") / "report.json")
+
+
+@pytest.fixture(scope="session", params=["quiet", "verbose"])
+def analyzed_minimal_verbosity(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> SimpleNamespace:
+    """``analyze`` on minimal.har, run once per ``--verbosity`` level."""
+    output = tmp_path_factory.mktemp(f"cli-{request.param}") / "report.json"
+    return _run_analyze(output, "--verbosity", request.param)
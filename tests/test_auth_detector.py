@@ -11,7 +11,7 @@ Ref:
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict
 
 import pytest
 
@@ -34,38 +34,9 @@ from src.input.models import (
 # Helpers
 # ---------------------------------------------------------------------------
 
-
-def _make_exchange(
-    cookies: Dict[str, str] | None = None,
-    headers: Dict[str, str] | None = None,
-    method: str = "GET",
-    url: str = "https://example.com/",
-) -> HttpExchange:
-    """Helper to create an HttpExchange with minimal boilerplate."""
-    return HttpExchange(
-        request_method=method,
-        request_url=url,
-        request_headers=headers or {},
-        request_cookies=cookies or {},
-        request_body=None,
-        request_content_type="",
-        response_status=200,
-        response_headers={},
-        response_body=None,
-        timestamp=datetime(2026, 1, 1),
-    )
-
-
-def _make_flow(
-    exchanges: List[HttpExchange],
-    session_id: str = "test-session",
-) -> SessionFlow:
-    """Helper to create a SessionFlow with NONE auth."""
-    return SessionFlow(
-        session_id=session_id,
-        exchanges=exchanges,
-        auth_mechanism=AuthMechanism.NONE,
-    )
+# Factory fixtures from conftest.py
+ExchangeFactory = Callable[..., HttpExchange]
+FlowFactory = Callable[..., SessionFlow]
 
 
 # ---------------------------------------------------------------------------
@@ -76,181 +47,200 @@ def _make_flow(
 class TestDetectAuthMechanism:
     """Tests for detect_auth_mechanism() — all 5 auth scenarios."""
 
-    def test_cookie_only(self) -> None:
+    def test_cookie_only(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
         """Session with cookies but no auth headers → COOKIE."""
-        flow = _make_flow([
-            _make_exchange(cookies={"session_id": "abc123"}),
+        flow = flow_factory([
+            exchange_factory(cookies={"session_id": "abc123"}),
         ])
         assert detect_auth_mechanism(flow) == AuthMechanism.COOKIE
 
-    def test_bearer_token_no_cookies(self) -> None:
-        """Session with Authorization header, no cookies → HEADER_ONLY."""
-        flow = _make_flow([
-            _make_exchange(headers={"Authorization": "Bearer eyJ..."}),
-        ])
-        assert detect_auth_mechanism(flow) == AuthMechanism.HEADER_ONLY
-
-    def test_api_key_no_cookies(self) -> None:
-        """Session with X-API-Key header, no cookies → HEADER_ONLY."""
-        flow = _make_flow([
-            _make_exchange(headers={"X-API-Key": "key_abc123"}),
-        ])
-        assert detect_auth_mechanism(flow) == AuthMechanism.HEADER_ONLY
-
-    def test_x_auth_token_no_cookies(self) -> None:
-        """Session with X-Auth-Token header → HEADER_ONLY."""
-        flow = _make_flow([
-            _make_exchange(headers={"X-Auth-Token": "tok_xyz"}),
-        ])
-        assert detect_auth_mechanism(flow) == AuthMechanism.HEADER_ONLY
-
-    def test_api_key_alt_no_cookies(self) -> None:
-        """Session with Api-Key header → HEADER_ONLY."""
-        flow = _make_flow([
-            _make_exchange(headers={"Api-Key": "ak_123"}),
-        ])
-        assert detect_auth_mechanism(flow) == AuthMechanism.HEADER_ONLY
-
-    def test_x_access_token_no_cookies(self) -> None:
-        """Session with X-Access-Token header → HEADER_ONLY."""
-        flow = _make_flow([
-            _make_exchange(headers={"X-Access-Token": "at_456"}),
-        ])
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"Authorization": "Bearer eyJ..."},
+            {"X-API-Key": "key_abc123"},
+            {"X-Auth-Token": "tok_xyz"},
+            {"Api-Key": "ak_123"},
+            {"X-Access-Token": "at_456"},
+            {"authorization": "Bearer eyJ..."},
+        ],
+        ids=["bearer", "x-api-key", "x-auth-token", "api-key", "x-access-token", "lowercase"],
+    )
+    def test_header_only(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+        headers: Dict[str, str],
+    ) -> None:
+        """Any auth header (matched case-insensitively), no cookies → HEADER_ONLY."""
+        flow = flow_factory([exchange_factory(headers=headers)])
         assert detect_auth_mechanism(flow) == AuthMechanism.HEADER_ONLY
 
-    def test_mixed_cookies_and_auth_header(self) -> None:
+    def test_mixed_cookies_and_auth_header(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
         """Session with both cookies and auth header → MIXED."""
-        flow = _make_flow([
-            _make_exchange(
+        flow = flow_factory([
+            exchange_factory(
                 cookies={"session_id": "abc123"},
                 headers={"Authorization": "Bearer eyJ..."},
             ),
         ])
         assert detect_auth_mechanism(flow) == AuthMechanism.MIXED
 
-    def test_no_cookies_no_headers(self) -> None:
+    def test_no_cookies_no_headers(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
         """Session with neither cookies nor auth headers → NONE."""
-        flow = _make_flow([
-            _make_exchange(cookies={}, headers={}),
+        flow = flow_factory([
+            exchange_factory(cookies={}, headers={}),
         ])
         assert detect_auth_mechanism(flow) == AuthMechanism.NONE
 
-    def test_non_session_cookies_only(self) -> None:
+    def test_non_session_cookies_only(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
         """Non-session cookies (e.g., tracking) → NONE."""
-        flow = _make_flow([
-            _make_exchange(cookies={"_ga": "GA1.2.123", "tracking": "xyz"}),
+        flow = flow_factory([
+            exchange_factory(cookies={"_ga": "GA1.2.123", "tracking": "xyz"}),
         ])
         assert detect_auth_mechanism(flow) == AuthMechanism.NONE
 
-    def test_multiple_exchanges_mixed(self) -> None:
+    def test_multiple_exchanges_mixed(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
         """Cookie in one exchange, auth header in another → MIXED."""
-        flow = _make_flow([
-            _make_exchange(cookies={"session_id": "abc123"}),
-            _make_exchange(headers={"Authorization": "Bearer eyJ..."}),
+        flow = flow_factory([
+            exchange_factory(cookies={"session_id": "abc123"}),
+            exchange_factory(headers={"Authorization": "Bearer eyJ..."}),
         ])
         assert detect_auth_mechanism(flow) == AuthMechanism.MIXED
 
-    def test_case_insensitive_header_matching(self) -> None:
-        """Auth header matching is case-insensitive."""
-        flow = _make_flow([
-            _make_exchange(headers={"authorization": "Bearer eyJ..."}),
-        ])
-        assert detect_auth_mechanism(flow) == AuthMechanism.HEADER_ONLY
-
-    def test_jsessionid_recognized(self) -> None:
+    def test_jsessionid_recognized(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
         """JSESSIONID cookie matches 'session' pattern → COOKIE."""
-        flow = _make_flow([
-            _make_exchange(cookies={"JSESSIONID": "jvm_abc"}),
+        flow = flow_factory([
+            exchange_factory(cookies={"JSESSIONID": "jvm_abc"}),
         ])
         assert detect_auth_mechanism(flow) == AuthMechanism.COOKIE
 
-    def test_custom_patterns(self) -> None:
+    def test_custom_patterns(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
         """Custom patterns override defaults."""
-        flow = _make_flow([
-            _make_exchange(cookies={"my_token": "tok123"}),
+        flow = flow_factory([
+            exchange_factory(cookies={"my_token": "tok123"}),
         ])
         # Default patterns won't match 'my_token'
         assert detect_auth_mechanism(flow) == AuthMechanism.NONE
         # Custom pattern matches
         assert detect_auth_mechanism(flow, cookie_patterns=["token"]) == AuthMechanism.COOKIE
 
+    def test_custom_auth_headers(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
+        """Custom auth headers override defaults and are matched case-insensitively."""
+        flow = flow_factory([
+            exchange_factory(headers={"X-Session-Token": "tok123"}),
+        ])
+        assert detect_auth_mechanism(flow) == AuthMechanism.NONE
+        mechanism = detect_auth_mechanism(flow, auth_headers=["x-session-TOKEN"])
+        assert mechanism == AuthMechanism.HEADER_ONLY
+
 
 # ---------------------------------------------------------------------------
 # Short-Circuit Result (T-142, T-143)
 # ---------------------------------------------------------------------------
 
 
-class TestBuildShortCircuitResult:
-    """Tests for build_short_circuit_result()."""
-
-    def test_risk_score_is_5(self) -> None:
-        """Short-circuit result has fixed risk score of 5."""
-        flow = _make_flow([
-            _make_exchange(headers={"Authorization": "Bearer eyJ..."}),
-        ])
-        result = build_short_circuit_result(flow)
-        assert result.risk_score == 5
+@pytest.fixture(scope="module")
+def bearer_result(
+    exchange_factory: ExchangeFactory,
+    flow_factory: FlowFactory,
+) -> AnalysisResult:
+    """Short-circuit result for a single-exchange Bearer flow, built once.
 
-    def test_risk_level_is_low(self) -> None:
-        """Short-circuit result has LOW risk level."""
-        flow = _make_flow([
-            _make_exchange(headers={"Authorization": "Bearer eyJ..."}),
-        ])
-        result = build_short_circuit_result(flow)
-        assert result.risk_level == RiskLevel.LOW
+    AnalysisResult is frozen, so the tests below can share one instance.
+    """
+    flow = flow_factory([
+        exchange_factory(headers={"Authorization": "Bearer eyJtoken"}),
+    ])
+    return build_short_circuit_result(flow)
 
-    def test_ml_probability_is_none(self) -> None:
-        """ML probability is None (ML pipeline skipped).
 
-        This is the critical NoneType safety test: ml_probability must be
-        None when the ML pipeline is skipped due to header-only auth.
-        The risk scorer must handle this gracefully without TypeError.
-        """
-        flow = _make_flow([
-            _make_exchange(headers={"Authorization": "Bearer eyJ..."}),
-        ])
-        result = build_short_circuit_result(flow)
-        assert result.ml_probability is None
+class TestBuildShortCircuitResult:
+    """Tests for build_short_circuit_result()."""
 
-    def test_feature_vector_is_none(self) -> None:
-        """Feature vector is None (feature extraction skipped)."""
-        flow = _make_flow([
-            _make_exchange(headers={"Authorization": "Bearer eyJ..."}),
-        ])
-        result = build_short_circuit_result(flow)
-        assert result.feature_vector is None
+    # NoneType safety: ml_probability and feature_vector must be None when the
+    # ML pipeline is skipped, and the risk scorer must handle that
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("risk_score", 5),
+            ("risk_level", RiskLevel.LOW),
+            ("ml_probability", None),
+            ("feature_vector", None),
+        ],
+    )
+    def test_fixed_fields(
+        self, bearer_result: AnalysisResult, field: str, expected: object
+    ) -> None:
+        """Fixed score 5 (LOW); ML probability and feature vector are skipped."""
+        assert getattr(bearer_result, field) == expected
 
-    def test_csrf_011_finding_present(self) -> None:
+    def test_csrf_011_finding_present(self, bearer_result: AnalysisResult) -> None:
         """Result contains exactly one CSRF-011 finding."""
-        flow = _make_flow([
-            _make_exchange(headers={"Authorization": "Bearer eyJ..."}),
+        findings = [(f.rule_id, f.severity) for f in bearer_result.findings]
+        assert findings == [("CSRF-011", Severity.INFO)]
+
+    def test_finding_has_evidence(self, bearer_result: AnalysisResult) -> None:
+        """CSRF-011 finding leads its evidence with the auth header."""
+        assert bearer_result.findings[0].evidence.startswith("Authorization: ")
+
+    def test_evidence_uses_canonical_header_name(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
+        """Evidence spells the header canonically and truncates long values."""
+        flow = flow_factory([
+            exchange_factory(headers={"authorization": "Bearer " + "x" * 60}),
         ])
         result = build_short_circuit_result(flow)
-        assert len(result.findings) == 1
-        assert result.findings[0].rule_id == "CSRF-011"
-        assert result.findings[0].severity == Severity.INFO
-
-    def test_finding_has_evidence(self) -> None:
-        """CSRF-011 finding includes auth header as evidence."""
-        flow = _make_flow([
-            _make_exchange(headers={"Authorization": "Bearer eyJtoken"}),
-        ])
-        result = build_short_circuit_result(flow)
-        assert "Authorization" in result.findings[0].evidence
+        assert result.findings[0].evidence == "Authorization: Bearer " + "x" * 43 + "..."
 
-    def test_recommendation_present(self) -> None:
+    def test_recommendation_present(self, bearer_result: AnalysisResult) -> None:
         """Result has a recommendation about CSRF not applicable."""
-        flow = _make_flow([
-            _make_exchange(headers={"Authorization": "Bearer eyJ..."}),
-        ])
-        result = build_short_circuit_result(flow)
-        assert len(result.recommendations) == 1
-        assert "not applicable" in result.recommendations[0].lower()
-
-    def test_endpoint_from_first_exchange(self) -> None:
+        assert len(bearer_result.recommendations) == 1
+        assert "not applicable" in bearer_result.recommendations[0].lower()
+
+    def test_endpoint_from_first_exchange(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
         """Endpoint is taken from the first exchange's URL."""
-        flow = _make_flow([
-            _make_exchange(
+        flow = flow_factory([
+            exchange_factory(
                 headers={"Authorization": "Bearer eyJ..."},
                 url="https://api.example.com/users/me",
             ),
@@ -258,6 +248,17 @@ class TestBuildShortCircuitResult:
         result = build_short_circuit_result(flow)
         assert result.endpoint == "https://api.example.com/users/me"
 
+    def test_empty_flow_uses_placeholder_exchange(self, flow_factory: FlowFactory) -> None:
+        """Empty flows share one read-only placeholder exchange with a fixed timestamp."""
+        first = build_short_circuit_result(flow_factory([]))
+        second = build_short_circuit_result(flow_factory([], session_id="other"))
+        assert first.endpoint == "unknown"
+        assert first.findings[0].exchange is second.findings[0].exchange
+        assert first.findings[0].exchange.timestamp == datetime.min
+        # The shared placeholder's mappings are read-only
+        with pytest.raises(TypeError):
+            first.findings[0].exchange.request_headers["X-Edited"] = "1"  # type: ignore[index]
+
 
 # ---------------------------------------------------------------------------
 # Update Flow Auth
@@ -267,34 +268,19 @@ class TestBuildShortCircuitResult:
 class TestUpdateFlowAuth:
     """Tests for update_flow_auth()."""
 
-    def test_updates_mechanism(self) -> None:
-        """update_flow_auth() detects and sets the auth mechanism."""
-        flow = _make_flow([
-            _make_exchange(cookies={"session_id": "abc123"}),
-        ])
+    def test_update_flow_auth(
+        self,
+        exchange_factory: ExchangeFactory,
+        flow_factory: FlowFactory,
+    ) -> None:
+        """update_flow_auth() sets the mechanism on a new flow, keeping ID and exchanges."""
+        ex = exchange_factory(cookies={"session_id": "abc123"})
+        flow = flow_factory([ex], session_id="my-session")
         assert flow.auth_mechanism == AuthMechanism.NONE
 
         updated = update_flow_auth(flow)
         assert updated.auth_mechanism == AuthMechanism.COOKIE
-
-    def test_preserves_session_id(self) -> None:
-        """Session ID is preserved in the updated flow."""
-        flow = _make_flow(
-            [_make_exchange(cookies={"session_id": "abc123"})],
-            session_id="my-session",
-        )
-        updated = update_flow_auth(flow)
         assert updated.session_id == "my-session"
-
-    def test_preserves_exchanges(self) -> None:
-        """Exchanges are preserved in the updated flow."""
-        ex = _make_exchange(cookies={"session_id": "abc123"})
-        flow = _make_flow([ex])
-        updated = update_flow_auth(flow)
         assert updated.exchanges == [ex]
-
-    def test_returns_new_instance(self) -> None:
-        """Returns a new SessionFlow (frozen, so cannot mutate)."""
-        flow = _make_flow([_make_exchange()])
-        updated = update_flow_auth(flow)
+        # SessionFlow is frozen, so a new instance is returned
         assert updated is not flow
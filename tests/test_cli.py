@@ -8,14 +8,38 @@ Ref:
 
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
 from src.main import main
 
-SAMPLE_DIR = Path(__file__).resolve().parent.parent / "data" / "sample_har"
+PROJECT_ROOT = Path(__file__).absolute().parent.parent
+SAMPLE_DIR = PROJECT_ROOT / "data" / "sample_har"
+_BEARER_HAR = str(SAMPLE_DIR / "bearer_auth.har")
+_FORM_HAR = str(SAMPLE_DIR / "form_urlencoded.har")
+
+# CliRunner keeps no state between invocations, so one instance serves all tests
+RUNNER = CliRunner()
+
+
+@pytest.fixture(scope="module")
+def help_results() -> Dict[str, Result]:
+    """Help and version output, rendered once per module, keyed by command."""
+    invocations = {
+        "main": ["--help"],
+        "no_command": [],
+        "analyze": ["analyze", "--help"],
+        "train": ["train", "--help"],
+        "version": ["--version"],
+    }
+    return {name: RUNNER.invoke(main, args) for name, args in invocations.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -26,24 +50,34 @@ SAMPLE_DIR = Path(__file__).resolve().parent.parent / "data" / "sample_har"
 class TestCliGroup:
     """Tests for the main CLI group."""
 
-    def test_version(self) -> None:
+    def test_version(self, help_results: Dict[str, Result]) -> None:
         """--version prints version string."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--version"])
+        result = help_results["version"]
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_help(self) -> None:
+    def test_help(self, help_results: Dict[str, Result]) -> None:
         """--help shows usage information."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
+        result = help_results["main"]
         assert result.exit_code == 0
         assert "CSRF Shield AI" in result.output
 
-    def test_no_command_shows_help(self) -> None:
+    def test_import_skips_analysis_pipeline(self) -> None:
+        """Importing the CLI loads neither the HAR parser nor orjson."""
+        code = (
+            "import sys, src.main; "
+            "print('src.input.har_parser' in sys.modules, 'orjson' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == "False False"
+
+    def test_no_command_shows_help(self, help_results: Dict[str, Result]) -> None:
         """Running with no subcommand shows help."""
-        runner = CliRunner()
-        result = runner.invoke(main)
+        result = help_results["no_command"]
         assert result.exit_code == 0
         assert "Usage" in result.output
 
@@ -56,36 +90,28 @@ class TestCliGroup:
 class TestAnalyzeCommand:
     """Tests for the analyze subcommand."""
 
-    def test_analyze_help(self) -> None:
+    def test_analyze_help(self, help_results: Dict[str, Result]) -> None:
         """analyze --help shows subcommand usage."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["analyze", "--help"])
+        result = help_results["analyze"]
         assert result.exit_code == 0
         assert "--input" in result.output
         assert "--format" in result.output
 
-    def test_analyze_minimal_har(self, tmp_path: Path) -> None:
+    def test_analyze_minimal_har(self, analyzed_minimal: SimpleNamespace) -> None:
         """analyze processes a valid HAR file."""
-        output = tmp_path / "report.json"
-        runner = CliRunner()
-        result = runner.invoke(main, [
-            "analyze",
-            "--input", str(SAMPLE_DIR / "minimal.har"),
-            "--output", str(output),
-        ])
+        result = analyzed_minimal.result
         assert result.exit_code == 0
         assert "Parsing HAR file" in result.output
         assert "Reconstructing session flows" in result.output
         assert "Analysis complete" in result.output
-        assert output.exists()
+        assert analyzed_minimal.output_path.exists()
 
     def test_analyze_bearer_short_circuits(self, tmp_path: Path) -> None:
         """analyze short-circuits bearer auth flows."""
         output = tmp_path / "report.json"
-        runner = CliRunner()
-        result = runner.invoke(main, [
+        result = RUNNER.invoke(main, [
             "analyze",
-            "--input", str(SAMPLE_DIR / "bearer_auth.har"),
+            "--input", _BEARER_HAR,
             "--output", str(output),
         ])
         assert result.exit_code == 0
@@ -93,34 +119,42 @@ class TestAnalyzeCommand:
 
     def test_analyze_missing_file(self) -> None:
         """analyze exits with error for missing file."""
-        runner = CliRunner()
-        result = runner.invoke(main, [
+        result = RUNNER.invoke(main, [
             "analyze",
             "--input", "/nonexistent/file.har",
         ])
         # Click's exists=True validation catches this
         assert result.exit_code != 0
 
-    def test_analyze_json_output(self, tmp_path: Path) -> None:
+    def test_analyze_json_output(self, analyzed_minimal: SimpleNamespace) -> None:
         """analyze produces valid JSON output."""
-        import json
-
-        output = tmp_path / "report.json"
-        runner = CliRunner()
-        runner.invoke(main, [
-            "analyze",
-            "--input", str(SAMPLE_DIR / "minimal.har"),
-            "--output", str(output),
-        ])
-        with open(output, encoding="utf-8") as f:
-            data = json.load(f)
+        data = analyzed_minimal.data
         assert "flows" in data
         assert "total_flows" in data
 
+    def test_analyze_json_output_without_orjson(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The stdlib json fallback writes the same report."""
+        outputs = {}
+        for name in ("fast", "stdlib"):
+            if name == "stdlib":
+                # A None entry makes `import orjson` raise ImportError
+                monkeypatch.setitem(sys.modules, "orjson", None)
+            outputs[name] = tmp_path / f"{name}.json"
+            # Only the report is compared, so skip CliRunner's isolation
+            main.main([
+                "analyze",
+                "--input", _FORM_HAR,
+                "--output", str(outputs[name]),
+            ], standalone_mode=False)
+        fast = json.loads(outputs["fast"].read_text(encoding="utf-8"))
+        stdlib = json.loads(outputs["stdlib"].read_text(encoding="utf-8"))
+        assert fast == stdlib
+
     def test_analyze_requires_input(self) -> None:
         """analyze fails without --input."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["analyze"])
+        result = RUNNER.invoke(main, ["analyze"])
         assert result.exit_code != 0
         assert "Missing option" in result.output or "required" in result.output.lower()
 
@@ -133,17 +167,15 @@ class TestAnalyzeCommand:
 class TestTrainCommand:
     """Tests for the train subcommand."""
 
-    def test_train_help(self) -> None:
+    def test_train_help(self, help_results: Dict[str, Result]) -> None:
         """train --help shows subcommand usage."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["train", "--help"])
+        result = help_results["train"]
         assert result.exit_code == 0
         assert "--data" in result.output
 
     def test_train_skeleton_message(self, tmp_path: Path) -> None:
         """train prints skeleton message."""
-        runner = CliRunner()
-        result = runner.invoke(main, [
+        result = RUNNER.invoke(main, [
             "train",
             "--data", str(tmp_path),
         ])
@@ -159,26 +191,9 @@ class TestTrainCommand:
 class TestVerbosity:
     """Tests for verbosity flag."""
 
-    def test_quiet_mode(self, tmp_path: Path) -> None:
-        """--verbosity quiet still runs analyze."""
-        output = tmp_path / "report.json"
-        runner = CliRunner()
-        result = runner.invoke(main, [
-            "--verbosity", "quiet",
-            "analyze",
-            "--input", str(SAMPLE_DIR / "minimal.har"),
-            "--output", str(output),
-        ])
-        assert result.exit_code == 0
-
-    def test_verbose_mode(self, tmp_path: Path) -> None:
-        """--verbosity verbose still runs analyze."""
-        output = tmp_path / "report.json"
-        runner = CliRunner()
-        result = runner.invoke(main, [
-            "--verbosity", "verbose",
-            "analyze",
-            "--input", str(SAMPLE_DIR / "minimal.har"),
-            "--output", str(output),
-        ])
-        assert result.exit_code == 0
+    def test_analyze_at_each_verbosity(
+        self, analyzed_minimal_verbosity: SimpleNamespace
+    ) -> None:
+        """--verbosity quiet and verbose still run analyze."""
+        assert analyzed_minimal_verbosity.result.exit_code == 0
+        assert analyzed_minimal_verbosity.data is not None
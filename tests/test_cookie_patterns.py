@@ -0,0 +1,54 @@
+"""Unit tests for session cookie name matching.
+
+Tests pattern compilation, caching, and default matcher selection.
+
+Ref:
+    - spec/Requirements.md FR-105, FR-106
+    - .agent/instructions/testing_strategy.instructions.md §2.1
+"""
+
+from __future__ import annotations
+
+import src.input.cookie_patterns as cookie_patterns
+from src.input.cookie_patterns import (
+    DEFAULT_SESSION_COOKIE_PATTERNS,
+    compile_cookie_patterns,
+    session_cookie_matcher,
+)
+
+
+# ---------------------------------------------------------------------------
+# Cookie Pattern Compilation
+# ---------------------------------------------------------------------------
+
+
+class TestCompileCookiePatterns:
+    """Tests for compile_cookie_patterns()."""
+
+    def test_patterns_are_literal(self) -> None:
+        """Regex metacharacters in patterns are matched literally."""
+        cookie_re = compile_cookie_patterns(("s.id",))
+        assert cookie_re.search("S.ID_cookie")
+        assert not cookie_re.search("sxid")
+
+    def test_default_patterns_precompiled(self) -> None:
+        """The default patterns are compiled once, at import."""
+        cookie_re = compile_cookie_patterns(DEFAULT_SESSION_COOKIE_PATTERNS)
+        assert cookie_re is cookie_patterns._DEFAULT_COOKIE_RE
+
+    def test_compiled_regex_is_cached(self) -> None:
+        """Same pattern tuple returns the same compiled regex."""
+        assert compile_cookie_patterns(("token",)) is compile_cookie_patterns(("token",))
+
+
+class TestSessionCookieMatcher:
+    """Tests for session_cookie_matcher()."""
+
+    def test_defaults_when_unset(self) -> None:
+        """None and an empty list both select the default matcher."""
+        assert session_cookie_matcher() is cookie_patterns._DEFAULT_COOKIE_RE
+        assert session_cookie_matcher([]) is cookie_patterns._DEFAULT_COOKIE_RE
+
+    def test_custom_patterns_compiled(self) -> None:
+        """Custom patterns, as a list, reuse the cached compiled regex."""
+        assert session_cookie_matcher(["token"]) is compile_cookie_patterns(("token",))
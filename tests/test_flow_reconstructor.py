@@ -11,41 +11,24 @@ Ref:
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Callable, Dict, List, Optional
 
 import pytest
 
-from src.input.flow_reconstructor import (
-    DEFAULT_SESSION_COOKIE_PATTERNS,
-    _identify_session,
-    reconstruct_flows,
-)
-from src.input.models import AuthMechanism, HttpExchange
+from src.input.cookie_patterns import session_cookie_matcher
+from src.input.flow_reconstructor import _identify_session, reconstruct_flows
+from src.input.models import AuthMechanism, HttpExchange, SessionFlow
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Factory fixture from conftest.py
+ExchangeFactory = Callable[..., HttpExchange]
 
-def _make_exchange(
-    method: str = "GET",
-    url: str = "https://example.com/",
-    cookies: dict | None = None,
-    timestamp: datetime | None = None,
-) -> HttpExchange:
-    """Helper to create an HttpExchange with minimal boilerplate."""
-    return HttpExchange(
-        request_method=method,
-        request_url=url,
-        request_headers={},
-        request_cookies=cookies or {},
-        request_body=None,
-        request_content_type="",
-        response_status=200,
-        response_headers={},
-        response_body=None,
-        timestamp=timestamp or datetime(2026, 1, 1),
-    )
+# Matcher for the default ("session", "sid", "auth") patterns
+DEFAULT_COOKIE_RE = session_cookie_matcher()
 
 
 # ---------------------------------------------------------------------------
@@ -56,60 +39,60 @@ def _make_exchange(
 class TestIdentifySession:
     """Tests for _identify_session()."""
 
-    def test_matches_session_id_cookie(self) -> None:
+    def test_matches_session_id_cookie(self, exchange_factory: ExchangeFactory) -> None:
         """Cookie named 'session_id' matches default pattern 'session'."""
-        ex = _make_exchange(cookies={"session_id": "abc123"})
-        result = _identify_session(ex, DEFAULT_SESSION_COOKIE_PATTERNS)
+        ex = exchange_factory(cookies={"session_id": "abc123"})
+        result = _identify_session(ex, DEFAULT_COOKIE_RE)
         assert result == "abc123"
 
-    def test_matches_sid_cookie(self) -> None:
+    def test_matches_sid_cookie(self, exchange_factory: ExchangeFactory) -> None:
         """Cookie named 'sid' matches default pattern 'sid'."""
-        ex = _make_exchange(cookies={"sid": "sess_xyz"})
-        result = _identify_session(ex, DEFAULT_SESSION_COOKIE_PATTERNS)
+        ex = exchange_factory(cookies={"sid": "sess_xyz"})
+        result = _identify_session(ex, DEFAULT_COOKIE_RE)
         assert result == "sess_xyz"
 
-    def test_matches_jsessionid(self) -> None:
+    def test_matches_jsessionid(self, exchange_factory: ExchangeFactory) -> None:
         """Cookie 'JSESSIONID' contains 'session' (case-insensitive)."""
-        ex = _make_exchange(cookies={"JSESSIONID": "jvm_abc"})
-        result = _identify_session(ex, DEFAULT_SESSION_COOKIE_PATTERNS)
+        ex = exchange_factory(cookies={"JSESSIONID": "jvm_abc"})
+        result = _identify_session(ex, DEFAULT_COOKIE_RE)
         assert result == "jvm_abc"
 
-    def test_matches_auth_token_cookie(self) -> None:
+    def test_matches_auth_token_cookie(self, exchange_factory: ExchangeFactory) -> None:
         """Cookie 'auth_token' matches default pattern 'auth'."""
-        ex = _make_exchange(cookies={"auth_token": "tok_456"})
-        result = _identify_session(ex, DEFAULT_SESSION_COOKIE_PATTERNS)
+        ex = exchange_factory(cookies={"auth_token": "tok_456"})
+        result = _identify_session(ex, DEFAULT_COOKIE_RE)
         assert result == "tok_456"
 
-    def test_case_insensitive(self) -> None:
+    def test_case_insensitive(self, exchange_factory: ExchangeFactory) -> None:
         """Pattern matching is case-insensitive."""
-        ex = _make_exchange(cookies={"SESSION_ID": "upper_case"})
-        result = _identify_session(ex, DEFAULT_SESSION_COOKIE_PATTERNS)
+        ex = exchange_factory(cookies={"SESSION_ID": "upper_case"})
+        result = _identify_session(ex, DEFAULT_COOKIE_RE)
         assert result == "upper_case"
 
-    def test_no_match_generates_fallback(self) -> None:
+    def test_no_match_generates_fallback(self, exchange_factory: ExchangeFactory) -> None:
         """No matching cookie generates a 'no-session-' prefixed ID."""
-        ex = _make_exchange(cookies={"tracking_id": "track123"})
-        result = _identify_session(ex, DEFAULT_SESSION_COOKIE_PATTERNS)
+        ex = exchange_factory(cookies={"tracking_id": "track123"})
+        result = _identify_session(ex, DEFAULT_COOKIE_RE)
         assert result.startswith("no-session-")
 
-    def test_no_cookies_generates_fallback(self) -> None:
+    def test_no_cookies_generates_fallback(self, exchange_factory: ExchangeFactory) -> None:
         """Exchange with no cookies generates a fallback ID."""
-        ex = _make_exchange(cookies={})
-        result = _identify_session(ex, DEFAULT_SESSION_COOKIE_PATTERNS)
+        ex = exchange_factory(cookies={})
+        result = _identify_session(ex, DEFAULT_COOKIE_RE)
         assert result.startswith("no-session-")
 
-    def test_custom_pattern(self) -> None:
+    def test_custom_pattern(self, exchange_factory: ExchangeFactory) -> None:
         """Custom cookie patterns are used when provided."""
-        ex = _make_exchange(cookies={"my_token": "custom123"})
-        result = _identify_session(ex, ["token"])
+        ex = exchange_factory(cookies={"my_token": "custom123"})
+        result = _identify_session(ex, session_cookie_matcher(["token"]))
         assert result == "custom123"
 
-    def test_first_match_wins(self) -> None:
+    def test_first_match_wins(self, exchange_factory: ExchangeFactory) -> None:
         """When multiple cookies match, the first one wins."""
-        ex = _make_exchange(
+        ex = exchange_factory(
             cookies={"session_id": "sess_1", "sid": "sess_2"}
         )
-        result = _identify_session(ex, DEFAULT_SESSION_COOKIE_PATTERNS)
+        result = _identify_session(ex, DEFAULT_COOKIE_RE)
         assert result == "sess_1"
 
 
@@ -118,80 +101,92 @@ class TestIdentifySession:
 # ---------------------------------------------------------------------------
 
 
-class TestReconstructFlows:
-    """Tests for reconstruct_flows()."""
+@pytest.fixture(scope="module")
+def capture_flows(exchange_factory: ExchangeFactory) -> List[SessionFlow]:
+    """Flows reconstructed once from a shuffled capture of several sessions.
 
-    def test_single_session(self) -> None:
-        """Exchanges with the same session cookie form one flow."""
-        exchanges = [
-            _make_exchange(cookies={"session_id": "s1"}, timestamp=datetime(2026, 1, 1, 12, 0)),
-            _make_exchange(cookies={"session_id": "s1"}, timestamp=datetime(2026, 1, 1, 12, 1)),
-        ]
-        flows = reconstruct_flows(exchanges)
-        assert len(flows) == 1
-        assert flows[0].session_id == "s1"
-        assert len(flows[0].exchanges) == 2
+    Session ``s1`` has three out-of-order requests around two cookieless
+    ones; ``s2``, ``early`` and ``late`` have one each.
+    """
 
-    def test_multiple_sessions(self) -> None:
-        """Different session cookies produce separate flows."""
-        exchanges = [
-            _make_exchange(cookies={"session_id": "s1"}, timestamp=datetime(2026, 1, 1, 12, 0)),
-            _make_exchange(cookies={"session_id": "s2"}, timestamp=datetime(2026, 1, 1, 12, 1)),
-            _make_exchange(cookies={"session_id": "s1"}, timestamp=datetime(2026, 1, 1, 12, 2)),
-        ]
-        flows = reconstruct_flows(exchanges)
-        assert len(flows) == 2
+    def at(session: Optional[str], path: str, when: datetime) -> HttpExchange:
+        cookies = {"session_id": session} if session else {}
+        return exchange_factory(url=f"https://example.com/{path}", cookies=cookies, timestamp=when)
+
+    exchanges = [
+        at("s1", "3", datetime(2026, 1, 1, 12, 30)),
+        at(None, "anon-a", datetime(2026, 1, 1, 12, 5)),
+        at("late", "late", datetime(2026, 1, 2)),
+        at("s2", "s2", datetime(2026, 1, 1, 12, 10)),
+        at("s1", "1", datetime(2026, 1, 1, 12, 0)),
+        at(None, "anon-b", datetime(2026, 1, 1, 12, 20)),
+        at("early", "early", datetime(2025, 12, 31)),
+        at("s1", "2", datetime(2026, 1, 1, 12, 15)),
+    ]
+    return reconstruct_flows(exchanges)
 
-        s1_flow = next(f for f in flows if f.session_id == "s1")
-        s2_flow = next(f for f in flows if f.session_id == "s2")
-        assert len(s1_flow.exchanges) == 2
-        assert len(s2_flow.exchanges) == 1
+
+@pytest.fixture(scope="module")
+def flows_by_id(capture_flows: List[SessionFlow]) -> Dict[str, SessionFlow]:
+    """``capture_flows`` indexed by session ID."""
+    return {f.session_id: f for f in capture_flows}
+
+
+class TestReconstructFlows:
+    """Tests for reconstruct_flows()."""
+
+    @pytest.mark.parametrize(
+        ("session_id", "n_exchanges"),
+        [("s1", 3), ("s2", 1), ("early", 1), ("late", 1)],
+    )
+    def test_groups_by_session_cookie(
+        self, flows_by_id: Dict[str, SessionFlow], session_id: str, n_exchanges: int
+    ) -> None:
+        """Exchanges sharing a session cookie form one flow, even when interleaved."""
+        assert len(flows_by_id[session_id].exchanges) == n_exchanges
+
+    def test_no_cookie_exchanges_separate(self, capture_flows: List[SessionFlow]) -> None:
+        """Exchanges without session cookies each get a unique fallback flow."""
+        fallback = [f for f in capture_flows if f.session_id.startswith("no-session-")]
+        assert len(fallback) == 2
+        assert all(len(f.exchanges) == 1 for f in fallback)
+        assert len(capture_flows) == 6
+
+    def test_session_ids_unique(
+        self, capture_flows: List[SessionFlow], flows_by_id: Dict[str, SessionFlow]
+    ) -> None:
+        """Each session ID appears in exactly one flow."""
+        assert len(flows_by_id) == len(capture_flows)
 
     def test_empty_exchanges(self) -> None:
         """Empty exchange list returns empty flows list."""
         flows = reconstruct_flows([])
         assert flows == []
 
-    def test_auth_mechanism_defaults_to_none(self) -> None:
+    def test_auth_mechanism_defaults_to_none(self, exchange_factory: ExchangeFactory) -> None:
         """Auth mechanism is set to NONE (real detection in T-141)."""
-        exchanges = [_make_exchange(cookies={"session_id": "s1"})]
+        exchanges = [exchange_factory(cookies={"session_id": "s1"})]
         flows = reconstruct_flows(exchanges)
         assert flows[0].auth_mechanism == AuthMechanism.NONE
 
-    def test_no_cookie_exchanges_separate(self) -> None:
-        """Exchanges without session cookies get unique fallback IDs."""
-        exchanges = [
-            _make_exchange(cookies={}, timestamp=datetime(2026, 1, 1, 12, 0)),
-            _make_exchange(cookies={}, timestamp=datetime(2026, 1, 1, 12, 1)),
-        ]
-        flows = reconstruct_flows(exchanges)
-        # Each gets a unique fallback → separate flows
-        assert len(flows) == 2
-        assert all(f.session_id.startswith("no-session-") for f in flows)
-
-    def test_mixed_cookie_and_no_cookie(self) -> None:
-        """Mix of session-cookied and cookieless exchanges."""
-        exchanges = [
-            _make_exchange(cookies={"session_id": "s1"}, timestamp=datetime(2026, 1, 1, 12, 0)),
-            _make_exchange(cookies={}, timestamp=datetime(2026, 1, 1, 12, 1)),
-            _make_exchange(cookies={"session_id": "s1"}, timestamp=datetime(2026, 1, 1, 12, 2)),
-        ]
-        flows = reconstruct_flows(exchanges)
-        # 1 flow for s1 + 1 flow for the no-cookie exchange
-        assert len(flows) == 2
-
-        s1_flow = next(f for f in flows if f.session_id == "s1")
-        assert len(s1_flow.exchanges) == 2
-
-    def test_custom_cookie_patterns(self) -> None:
+    def test_custom_cookie_patterns(self, exchange_factory: ExchangeFactory) -> None:
         """Custom cookie patterns can be passed to reconstruct_flows."""
-        exchanges = [
-            _make_exchange(cookies={"my_token": "tok_1"}, timestamp=datetime(2026, 1, 1)),
-        ]
+        exchanges = [exchange_factory(cookies={"my_token": "tok_1"})]
         flows = reconstruct_flows(exchanges, cookie_patterns=["token"])
         assert len(flows) == 1
         assert flows[0].session_id == "tok_1"
 
+    def test_accepts_iterator(self, exchange_factory: ExchangeFactory) -> None:
+        """A single-pass iterator of exchanges is grouped like a list."""
+        exchanges = [
+            exchange_factory(cookies={"session_id": "s1"}, timestamp=datetime(2026, 1, 1, 12, 1)),
+            exchange_factory(cookies={"session_id": "s1"}, timestamp=datetime(2026, 1, 1, 12, 0)),
+        ]
+        flows = reconstruct_flows(iter(exchanges))
+        assert len(flows) == 1
+        assert flows[0].exchanges == [exchanges[1], exchanges[0]]
+        assert reconstruct_flows(iter([])) == []
+
 
 # ---------------------------------------------------------------------------
 # Chronological Sorting (T-133)
@@ -201,41 +196,18 @@ class TestReconstructFlows:
 class TestChronologicalSorting:
     """Tests for chronological ordering within flows."""
 
-    def test_sorts_exchanges_by_timestamp(self) -> None:
+    def test_sorts_exchanges_by_timestamp(self, flows_by_id: Dict[str, SessionFlow]) -> None:
         """Exchanges within a flow are sorted by timestamp."""
-        exchanges = [
-            _make_exchange(
-                url="https://example.com/3",
-                cookies={"session_id": "s1"},
-                timestamp=datetime(2026, 1, 1, 12, 30),
-            ),
-            _make_exchange(
-                url="https://example.com/1",
-                cookies={"session_id": "s1"},
-                timestamp=datetime(2026, 1, 1, 12, 0),
-            ),
-            _make_exchange(
-                url="https://example.com/2",
-                cookies={"session_id": "s1"},
-                timestamp=datetime(2026, 1, 1, 12, 15),
-            ),
-        ]
-        flows = reconstruct_flows(exchanges)
-        assert len(flows) == 1
-
-        urls = [e.request_url for e in flows[0].exchanges]
+        urls = [e.request_url for e in flows_by_id["s1"].exchanges]
         assert urls == [
             "https://example.com/1",
             "https://example.com/2",
             "https://example.com/3",
         ]
 
-    def test_flows_sorted_by_first_exchange(self) -> None:
+    def test_flows_sorted_by_first_exchange(self, capture_flows: List[SessionFlow]) -> None:
         """Multiple flows are sorted by their first exchange timestamp."""
-        exchanges = [
-            _make_exchange(cookies={"session_id": "late"}, timestamp=datetime(2026, 1, 2)),
-            _make_exchange(cookies={"session_id": "early"}, timestamp=datetime(2026, 1, 1)),
-        ]
-        flows = reconstruct_flows(exchanges)
-        assert flows[0].session_id == "early"
-        assert flows[1].session_id == "late"
+        firsts = [f.exchanges[0].timestamp for f in capture_flows]
+        assert firsts == sorted(firsts)
+        assert capture_flows[0].session_id == "early"
+        assert capture_flows[-1].session_id == "late"
@@ -11,18 +11,37 @@ Ref:
 from __future__ import annotations
 
 import json
+from datetime import date, datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
 
 import pytest
 
-from src.input.har_parser import HarParseError, parse_har_file
+import src.input.har_parser as har_parser
+from src.input.har_parser import (
+    HarParseError,
+    iter_har_file,
+    parse_har_bytes,
+    parse_har_file,
+)
 from src.input.models import HttpExchange
 
 # ---------------------------------------------------------------------------
-# Paths
+# Paths & Helpers
 # ---------------------------------------------------------------------------
 
-SAMPLE_DIR = Path(__file__).resolve().parent.parent / "data" / "sample_har"
+SAMPLE_DIR = Path(__file__).absolute().parent.parent / "data" / "sample_har"
+
+# The conftest.py fixture of parsed sample HARs, keyed by file stem
+SampleExchanges = Dict[str, List[HttpExchange]]
+
+
+def _write_har(path: Path, data: object) -> None:
+    """Write ``data`` as JSON, with orjson when the parser has it installed."""
+    if har_parser.orjson is not None:
+        path.write_bytes(har_parser.orjson.dumps(data))
+    else:
+        path.write_text(json.dumps(data), encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -33,47 +52,153 @@ SAMPLE_DIR = Path(__file__).resolve().parent.parent / "data" / "sample_har"
 class TestParseHarFileValid:
     """Tests for parse_har_file() with valid HAR files."""
 
-    def test_minimal_har(self) -> None:
-        """Parse minimal.har — single GET request."""
-        exchanges = parse_har_file(SAMPLE_DIR / "minimal.har")
+    def test_minimal_har(self, sample_exchanges: SampleExchanges) -> None:
+        """Parse minimal.har — single GET request, no request body.
+
+        The response body comes from content.text and the timestamp from
+        startedDateTime.
+        """
+        exchanges = sample_exchanges["minimal"]
         assert len(exchanges) == 1
 
         ex = exchanges[0]
         assert isinstance(ex, HttpExchange)
-        assert ex.request_method == "GET"
-        assert ex.request_url == "https://example.com/"
-        assert ex.response_status == 200
+        fields = (
+            ex.request_method,
+            ex.request_url,
+            ex.request_body,
+            ex.response_status,
+            ex.response_body,
+            ex.timestamp.date(),
+        )
+        assert fields == (
+            "GET",
+            "https://example.com/",
+            None,
+            200,
+            "<html><body>Welcome</body></html>",
+            date(2026, 2, 24),
+        )
+
+    def test_method_normalized(self) -> None:
+        """Methods are uppercased, including ones outside the standard set."""
+        entries = [
+            {
+                "request": {"method": method, "url": "https://example.com/"},
+                "response": {"status": 200},
+            }
+            for method in ("post", "Delete", "PROPFIND")
+        ]
+        data = json.dumps({"log": {"entries": entries}})
+        methods = [ex.request_method for ex in parse_har_bytes(data)]
+        assert methods == ["POST", "DELETE", "PROPFIND"]
 
-    def test_minimal_har_headers(self) -> None:
+    def test_minimal_har_headers(self, sample_exchanges: SampleExchanges) -> None:
         """Headers are extracted as a flat dict."""
-        exchanges = parse_har_file(SAMPLE_DIR / "minimal.har")
+        exchanges = sample_exchanges["minimal"]
         ex = exchanges[0]
         assert ex.request_headers["Host"] == "example.com"
         assert ex.request_headers["Accept"] == "text/html"
 
-    def test_minimal_har_response_body(self) -> None:
-        """Response body is extracted from content.text."""
-        exchanges = parse_har_file(SAMPLE_DIR / "minimal.har")
-        ex = exchanges[0]
-        assert ex.response_body == "<html><body>Welcome</body></html>"
-
-    def test_minimal_har_no_body(self) -> None:
-        """GET request has no request body."""
-        exchanges = parse_har_file(SAMPLE_DIR / "minimal.har")
-        ex = exchanges[0]
-        assert ex.request_body is None
-
-    def test_minimal_har_timestamp(self) -> None:
-        """Timestamp is parsed from startedDateTime."""
-        exchanges = parse_har_file(SAMPLE_DIR / "minimal.har")
-        ex = exchanges[0]
-        assert ex.timestamp.year == 2026
-        assert ex.timestamp.month == 2
-        assert ex.timestamp.day == 24
-
-    def test_response_cookies_in_headers(self) -> None:
+    def test_headers_case_insensitive(self, sample_exchanges: SampleExchanges) -> None:
+        """Headers can be looked up with any casing."""
+        ex = sample_exchanges["minimal"][0]
+        assert ex.request_headers["host"] == "example.com"
+        assert ex.request_headers.get("HOST") == "example.com"
+        assert "ACCEPT" in ex.request_headers
+
+    def test_duplicate_headers_joined(self) -> None:
+        """Repeated headers, in any casing, are joined in order with ', '."""
+        headers = har_parser._extract_headers([
+            {"name": "Via", "value": "1.1 a"},
+            {"name": "Host", "value": "example.com"},
+            {"name": "via", "value": "1.1 b"},
+            {"name": "VIA", "value": "1.1 c"},
+        ])
+        assert headers["Via"] == "1.1 a, 1.1 b, 1.1 c"
+        assert headers["Host"] == "example.com"
+
+    def test_non_string_headers_dropped(self) -> None:
+        """Headers whose name or value is null or not a string are skipped."""
+        headers = har_parser._extract_headers([
+            {"name": None, "value": "x"},
+            {"name": 7, "value": "y"},
+            {"value": "z"},
+            {"name": "X-A", "value": None},
+            {"name": "x-a", "value": "v"},
+            {"name": "Host", "value": "example.com"},
+        ])
+        assert headers == {"x-a": "v", "host": "example.com"}
+
+    def test_header_names_interned(self) -> None:
+        """Header names are shared string objects across exchanges."""
+        first = parse_har_file(SAMPLE_DIR / "minimal.har")[0]
+        second = parse_har_file(SAMPLE_DIR / "minimal.har")[0]
+        assert first is not second
+        name_a = next(k for k in first.request_headers if k == "host")
+        name_b = next(k for k in second.request_headers if k == "host")
+        assert name_a is name_b
+
+    def test_repeated_values_shared(self, sample_har_bytes: Dict[str, bytes]) -> None:
+        """Equal header and cookie values share one string within a parse."""
+        entry = json.loads(sample_har_bytes["form_urlencoded.har"])["log"]["entries"][0]
+        data = json.dumps({"log": {"version": "1.2", "entries": [entry, entry]}})
+        first, second = parse_har_bytes(data)
+        assert first.request_headers["host"] is second.request_headers["host"]
+        assert first.request_cookies["session_id"] is second.request_cookies["session_id"]
+
+    @pytest.mark.parametrize("use_ciso8601", [True, False], ids=["ciso8601", "stdlib"])
+    def test_timestamp_parsers_agree(
+        self, use_ciso8601: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Offsets and a trailing Z parse the same with either parser."""
+        if not use_ciso8601:
+            monkeypatch.setattr(har_parser, "_parse_iso8601", None)
+        elif har_parser._parse_iso8601 is None:
+            pytest.skip("ciso8601 not installed")
+        parsed = har_parser._parse_timestamp("2026-02-24T12:00:00.000+07:00")
+        assert parsed == datetime(2026, 2, 24, 5, 0, tzinfo=timezone.utc)
+        parsed = har_parser._parse_timestamp("2026-01-01T00:00:00.000Z")
+        assert parsed == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def test_each_call_returns_fresh_exchanges(self) -> None:
+        """Repeat parses share no objects, so one caller's edits stay local."""
+        path = SAMPLE_DIR / "minimal.har"
+        first = parse_har_file(path)[0]
+        first.request_headers["X-Edited"] = "1"
+        second = parse_har_file(path)[0]
+        assert second is not first
+        assert "x-edited" not in second.request_headers
+
+    def test_modified_file_is_reparsed(
+        self, tmp_path: Path, sample_har_bytes: Dict[str, bytes]
+    ) -> None:
+        """Rewriting the file changes what the next parse returns."""
+        har_file = tmp_path / "changing.har"
+        har_file.write_bytes(sample_har_bytes["minimal.har"])
+        assert len(parse_har_file(har_file)) == 1
+        _write_har(har_file, {"log": {"version": "1.2", "entries": []}})
+        assert parse_har_file(har_file) == []
+
+    def test_response_body_can_be_skipped(self) -> None:
+        """include_response_body=False leaves response_body unset."""
+        path = SAMPLE_DIR / "minimal.har"
+        ex = parse_har_file(path, include_response_body=False)[0]
+        assert ex.response_body is None
+        assert list(iter_har_file(path, include_response_body=False)) == [ex]
+        assert parse_har_file(path)[0].response_body is not None
+
+    def test_stdlib_json_fallback(
+        self, sample_exchanges: SampleExchanges, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without orjson, the stdlib decoder yields the same exchanges."""
+        monkeypatch.setattr(har_parser, "orjson", None)
+        for stem, expected in sample_exchanges.items():
+            assert parse_har_file(SAMPLE_DIR / f"{stem}.har") == expected
+
+    def test_response_cookies_in_headers(self, sample_exchanges: SampleExchanges) -> None:
         """Response Set-Cookie appears in response_headers."""
-        exchanges = parse_har_file(SAMPLE_DIR / "minimal.har")
+        exchanges = sample_exchanges["minimal"]
         ex = exchanges[0]
         assert "Set-Cookie" in ex.response_headers
 
@@ -86,29 +211,18 @@ class TestParseHarFileValid:
 class TestFormUrlEncoded:
     """Tests for application/x-www-form-urlencoded body parsing."""
 
-    def test_form_body_extracted(self) -> None:
+    def test_form_body_extracted(self, sample_exchanges: SampleExchanges) -> None:
         """Form body text is extracted from postData.text."""
-        exchanges = parse_har_file(SAMPLE_DIR / "form_urlencoded.har")
+        exchanges = sample_exchanges["form_urlencoded"]
         ex = exchanges[0]
         assert ex.request_body is not None
         assert "csrf_token=a1b2c3d4e5f6g7h8i9j0" in ex.request_body
 
-    def test_form_content_type(self) -> None:
-        """Content type is set to urlencoded."""
-        exchanges = parse_har_file(SAMPLE_DIR / "form_urlencoded.har")
-        ex = exchanges[0]
-        assert "x-www-form-urlencoded" in ex.request_content_type
-
-    def test_form_method_is_post(self) -> None:
-        """Request method is POST."""
-        exchanges = parse_har_file(SAMPLE_DIR / "form_urlencoded.har")
-        ex = exchanges[0]
+    def test_form_request_fields(self, sample_exchanges: SampleExchanges) -> None:
+        """A urlencoded POST carrying the session cookie."""
+        ex = sample_exchanges["form_urlencoded"][0]
         assert ex.request_method == "POST"
-
-    def test_form_cookies(self) -> None:
-        """Session cookie is extracted."""
-        exchanges = parse_har_file(SAMPLE_DIR / "form_urlencoded.har")
-        ex = exchanges[0]
+        assert "x-www-form-urlencoded" in ex.request_content_type
         assert ex.request_cookies.get("session_id") == "abc123"
 
 
@@ -120,24 +234,18 @@ class TestFormUrlEncoded:
 class TestMultipartForm:
     """Tests for multipart/form-data body parsing (text fields only)."""
 
-    def test_multipart_body_extracted(self) -> None:
+    def test_multipart_body_extracted(self, sample_exchanges: SampleExchanges) -> None:
         """Multipart body text is returned as raw string."""
-        exchanges = parse_har_file(SAMPLE_DIR / "multipart_form.har")
+        exchanges = sample_exchanges["multipart_form"]
         ex = exchanges[0]
         assert ex.request_body is not None
         assert "csrf_token" in ex.request_body
         assert "My Document" in ex.request_body
 
-    def test_multipart_content_type(self) -> None:
-        """Content type includes multipart/form-data."""
-        exchanges = parse_har_file(SAMPLE_DIR / "multipart_form.har")
-        ex = exchanges[0]
+    def test_multipart_content_type_and_status(self, sample_exchanges: SampleExchanges) -> None:
+        """Content type includes multipart/form-data; response is 201 Created."""
+        ex = sample_exchanges["multipart_form"][0]
         assert "multipart/form-data" in ex.request_content_type
-
-    def test_multipart_response_status(self) -> None:
-        """Response status is 201 Created."""
-        exchanges = parse_har_file(SAMPLE_DIR / "multipart_form.har")
-        ex = exchanges[0]
         assert ex.response_status == 201
 
 
@@ -146,31 +254,37 @@ class TestMultipartForm:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def json_bodies(sample_exchanges: SampleExchanges) -> Tuple[Any, Any]:
+    """Decoded request and response bodies of json_body.har, decoded once.
+
+    Bodies are kept as raw strings on the exchange; decoding them checks
+    that the text survived parsing intact.
+    """
+    ex = sample_exchanges["json_body"][0]
+    assert ex.request_body is not None
+    assert ex.response_body is not None
+    return json.loads(ex.request_body), json.loads(ex.response_body)
+
+
 class TestJsonBody:
     """Tests for application/json body parsing."""
 
-    def test_json_body_extracted(self) -> None:
+    def test_json_body_extracted(self, json_bodies: Tuple[Any, Any]) -> None:
         """JSON body text is returned as raw string."""
-        exchanges = parse_har_file(SAMPLE_DIR / "json_body.har")
-        ex = exchanges[0]
-        assert ex.request_body is not None
-        # Verify it's valid JSON and contains expected fields
-        body = json.loads(ex.request_body)
+        body, _ = json_bodies
         assert body["name"] == "Jane Doe"
         assert body["role"] == "admin"
 
-    def test_json_content_type(self) -> None:
+    def test_json_content_type(self, sample_exchanges: SampleExchanges) -> None:
         """Content type is application/json."""
-        exchanges = parse_har_file(SAMPLE_DIR / "json_body.har")
+        exchanges = sample_exchanges["json_body"]
         ex = exchanges[0]
         assert "application/json" in ex.request_content_type
 
-    def test_json_response_body(self) -> None:
+    def test_json_response_body(self, json_bodies: Tuple[Any, Any]) -> None:
         """Response body contains JSON data."""
-        exchanges = parse_har_file(SAMPLE_DIR / "json_body.har")
-        ex = exchanges[0]
-        assert ex.response_body is not None
-        resp = json.loads(ex.response_body)
+        _, resp = json_bodies
         assert resp["id"] == 42
 
 
@@ -182,9 +296,9 @@ class TestJsonBody:
 class TestTruncatedBody:
     """Tests for postData.params fallback when .text is missing (FR-107)."""
 
-    def test_params_fallback_reconstructs_body(self) -> None:
+    def test_params_fallback_reconstructs_body(self, sample_exchanges: SampleExchanges) -> None:
         """When postData.text is missing, body is rebuilt from .params."""
-        exchanges = parse_har_file(SAMPLE_DIR / "truncated_body.har")
+        exchanges = sample_exchanges["truncated_body"]
         ex = exchanges[0]
         assert ex.request_body is not None
         # Params fallback produces URL-encoded body
@@ -192,9 +306,19 @@ class TestTruncatedBody:
         assert "language=en" in ex.request_body
         assert "csrf_token=truncated_tok_abc123" in ex.request_body
 
-    def test_params_fallback_content_type(self) -> None:
+    def test_params_fallback_quotes_like_urlencode(self) -> None:
+        """Reserved and non-ASCII characters are form-encoded."""
+        body = har_parser._params_fallback([
+            {"name": "a b", "value": "x&y=z"},
+            {"name": "é", "value": "ü+/"},
+            {"name": None, "value": "dropped"},
+            {"name": "n", "value": 5},
+        ])
+        assert body == "a+b=x%26y%3Dz&%C3%A9=%C3%BC%2B%2F&n=5"
+
+    def test_params_fallback_content_type(self, sample_exchanges: SampleExchanges) -> None:
         """Content type is preserved from postData.mimeType."""
-        exchanges = parse_har_file(SAMPLE_DIR / "truncated_body.har")
+        exchanges = sample_exchanges["truncated_body"]
         ex = exchanges[0]
         assert "x-www-form-urlencoded" in ex.request_content_type
 
@@ -207,24 +331,17 @@ class TestTruncatedBody:
 class TestBearerAuthHar:
     """Tests for bearer_auth.har fixture parsing."""
 
-    def test_bearer_auth_headers(self) -> None:
+    def test_bearer_auth_headers(self, sample_exchanges: SampleExchanges) -> None:
         """Authorization header is extracted."""
-        exchanges = parse_har_file(SAMPLE_DIR / "bearer_auth.har")
+        exchanges = sample_exchanges["bearer_auth"]
         ex = exchanges[0]
         assert "Authorization" in ex.request_headers
         assert ex.request_headers["Authorization"].startswith("Bearer ")
 
-    def test_bearer_auth_no_cookies(self) -> None:
-        """No cookies in a Bearer-only request."""
-        exchanges = parse_har_file(SAMPLE_DIR / "bearer_auth.har")
-        ex = exchanges[0]
-        assert ex.request_cookies == {}
-
-    def test_bearer_auth_no_body(self) -> None:
-        """GET request has no body."""
-        exchanges = parse_har_file(SAMPLE_DIR / "bearer_auth.har")
-        ex = exchanges[0]
-        assert ex.request_body is None
+    def test_bearer_auth_no_cookies_or_body(self, sample_exchanges: SampleExchanges) -> None:
+        """A Bearer-only GET carries neither cookies nor a body."""
+        ex = sample_exchanges["bearer_auth"][0]
+        assert (ex.request_cookies, ex.request_body) == ({}, None)
 
 
 # ---------------------------------------------------------------------------
@@ -235,10 +352,13 @@ class TestBearerAuthHar:
 class TestHarParseErrors:
     """Tests for invalid HAR files and error conditions."""
 
-    def test_file_not_found(self, tmp_path: Path) -> None:
-        """FileNotFoundError raised for missing file."""
+    @pytest.mark.parametrize("parse", [parse_har_file, iter_har_file], ids=["parse", "iter"])
+    def test_file_not_found(self, tmp_path: Path, parse: Callable[[Path], object]) -> None:
+        """FileNotFoundError raised for a missing path or a directory, before decoding."""
         with pytest.raises(FileNotFoundError):
-            parse_har_file(tmp_path / "nonexistent.har")
+            parse(tmp_path / "nonexistent.har")
+        with pytest.raises(FileNotFoundError, match="not a regular file"):
+            parse(tmp_path)
 
     def test_invalid_json(self, tmp_path: Path) -> None:
         """HarParseError raised for invalid JSON."""
@@ -247,26 +367,48 @@ class TestHarParseErrors:
         with pytest.raises(HarParseError, match="Invalid JSON"):
             parse_har_file(bad_file)
 
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """HarParseError raised for an empty file."""
+        empty_file = tmp_path / "empty_file.har"
+        empty_file.write_bytes(b"")
+        with pytest.raises(HarParseError, match="Invalid JSON"):
+            parse_har_file(empty_file)
+
     def test_missing_log_key(self, tmp_path: Path) -> None:
         """HarParseError raised when 'log' key is missing."""
         bad_file = tmp_path / "no_log.har"
-        bad_file.write_text(json.dumps({"version": "1.2"}))
+        _write_har(bad_file, {"version": "1.2"})
         with pytest.raises(HarParseError, match="Missing required 'log'"):
             parse_har_file(bad_file)
 
     def test_missing_entries_key(self, tmp_path: Path) -> None:
         """HarParseError raised when 'entries' key is missing."""
         bad_file = tmp_path / "no_entries.har"
-        bad_file.write_text(json.dumps({"log": {"version": "1.2"}}))
+        _write_har(bad_file, {"log": {"version": "1.2"}})
         with pytest.raises(HarParseError, match="Missing required 'entries'"):
             parse_har_file(bad_file)
 
+    @pytest.mark.parametrize(
+        ("payload", "message"),
+        [
+            ([], "HAR data must be a JSON object"),
+            ({"log": []}, "'log' must be a JSON object"),
+            ({"log": "1.2"}, "'log' must be a JSON object"),
+            ({"log": {"entries": {}}}, "'entries' must be a JSON array"),
+        ],
+        ids=["root-array", "log-array", "log-string", "entries-object"],
+    )
+    def test_malformed_structure(self, tmp_path: Path, payload: object, message: str) -> None:
+        """Each structural problem keeps its own error message."""
+        bad_file = tmp_path / "malformed.har"
+        _write_har(bad_file, payload)
+        with pytest.raises(HarParseError, match=message):
+            parse_har_file(bad_file)
+
     def test_empty_entries(self, tmp_path: Path) -> None:
         """Empty entries list returns empty exchanges list."""
         har_file = tmp_path / "empty.har"
-        har_file.write_text(
-            json.dumps({"log": {"version": "1.2", "entries": []}})
-        )
+        _write_har(har_file, {"log": {"version": "1.2", "entries": []}})
         exchanges = parse_har_file(har_file)
         assert exchanges == []
 
@@ -295,7 +437,141 @@ class TestHarParseErrors:
             }
         }
         har_file = tmp_path / "mixed.har"
-        har_file.write_text(json.dumps(har_data))
+        _write_har(har_file, har_data)
         exchanges = parse_har_file(har_file)
         assert len(exchanges) == 1
         assert exchanges[0].request_method == "GET"
+
+    def test_null_fields_tolerated(self) -> None:
+        """Null mimeType and cookie names are tolerated; a null method skips the entry."""
+        entry = {
+            "request": {
+                "method": "POST",
+                "url": "https://example.com/",
+                "cookies": [{"name": None, "value": "x"}, {"name": "sid", "value": "abc"}],
+                "postData": {"mimeType": None, "text": "a=1"},
+            },
+            "response": {"status": 200},
+        }
+        bad_method = {**entry, "request": {**entry["request"], "method": None}}
+        har = {"log": {"version": "1.2", "entries": [bad_method, entry]}}
+        (exchange,) = parse_har_bytes(json.dumps(har))
+        assert exchange.request_content_type == ""
+        assert exchange.request_cookies == {"sid": "abc"}
+        assert exchange.request_body == "a=1"
+
+
+# ---------------------------------------------------------------------------
+# Parallel Parsing
+# ---------------------------------------------------------------------------
+
+
+class TestParallelParse:
+    """Tests for opt-in process-pool parsing of large captures."""
+
+    @pytest.fixture
+    def many_entries_har(self, tmp_path: Path, sample_har_bytes: Dict[str, bytes]) -> Path:
+        """A 21-entry capture whose eighth entry is malformed."""
+        entries = []
+        for i in range(20):
+            item = json.loads(sample_har_bytes["form_urlencoded.har"])["log"]["entries"][0]
+            item["request"]["url"] = f"https://example.com/item/{i}"
+            entries.append(item)
+        entries.insert(7, {})  # malformed — skipped
+        har_file = tmp_path / "many.har"
+        _write_har(har_file, {"log": {"version": "1.2", "entries": entries}})
+        return har_file
+
+    def test_parallel_matches_serial(
+        self, many_entries_har: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parallel parsing keeps entry order and skips malformed entries."""
+        serial = parse_har_file(many_entries_har)
+        monkeypatch.setattr(har_parser, "PARALLEL_PARSE_THRESHOLD", 1)
+        monkeypatch.setattr(har_parser, "_PARSE_CHUNK_SIZE", 3)
+        parallel = parse_har_file(many_entries_har, workers=2)
+
+        assert len(parallel) == 20
+        assert parallel == serial
+
+    def test_serial_by_default(
+        self, many_entries_har: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without workers, even captures over the threshold start no pool."""
+        monkeypatch.setattr(har_parser, "PARALLEL_PARSE_THRESHOLD", 1)
+        monkeypatch.setattr(har_parser, "ProcessPoolExecutor", None)
+        assert len(parse_har_file(many_entries_har)) == 20
+
+
+# ---------------------------------------------------------------------------
+# In-Memory Parsing
+# ---------------------------------------------------------------------------
+
+
+class TestParseHarBytes:
+    """Tests for parse_har_bytes() on in-memory documents."""
+
+    @pytest.mark.parametrize("name", sorted(p.name for p in SAMPLE_DIR.glob("*.har")))
+    def test_matches_parse_har_file(self, name: str, sample_har_bytes: Dict[str, bytes]) -> None:
+        """Bytes and text input yield the same exchanges as the file parse."""
+        data = sample_har_bytes[name]
+        expected = parse_har_file(SAMPLE_DIR / name)
+        assert parse_har_bytes(data) == expected
+        assert parse_har_bytes(data.decode("utf-8")) == expected
+
+    def test_invalid_json(self) -> None:
+        """HarParseError raised for non-JSON data."""
+        with pytest.raises(HarParseError, match="Invalid JSON"):
+            parse_har_bytes(b"not json {{{")
+
+    def test_missing_log_key(self) -> None:
+        """Structural validation matches parse_har_file."""
+        with pytest.raises(HarParseError, match="Missing required 'log'"):
+            parse_har_bytes(b'{"version": "1.2"}')
+
+
+# ---------------------------------------------------------------------------
+# Streaming API
+# ---------------------------------------------------------------------------
+
+
+class TestIterHarFile:
+    """Tests for iter_har_file() incremental parsing."""
+
+    @pytest.mark.parametrize("name", sorted(p.name for p in SAMPLE_DIR.glob("*.har")))
+    def test_matches_parse_har_file(self, name: str) -> None:
+        """Streaming yields the same exchanges as the full parse."""
+        path = SAMPLE_DIR / name
+        assert list(iter_har_file(path)) == parse_har_file(path)
+
+    def test_fallback_without_ijson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without ijson, iteration falls back to the full parse."""
+        monkeypatch.setattr(har_parser, "ijson", None)
+        path = SAMPLE_DIR / "minimal.har"
+        assert list(iter_har_file(path)) == parse_har_file(path)
+
+    def test_file_not_found_raised_eagerly(self, tmp_path: Path) -> None:
+        """FileNotFoundError is raised before iteration starts."""
+        with pytest.raises(FileNotFoundError):
+            iter_har_file(tmp_path / "nonexistent.har")
+
+    def test_invalid_json(self, tmp_path: Path) -> None:
+        """HarParseError raised for invalid JSON."""
+        bad_file = tmp_path / "bad.har"
+        bad_file.write_text("not json {{{")
+        with pytest.raises(HarParseError, match="Invalid JSON"):
+            list(iter_har_file(bad_file))
+
+    def test_missing_log_key(self, tmp_path: Path) -> None:
+        """HarParseError raised when 'log' key is missing."""
+        bad_file = tmp_path / "no_log.har"
+        _write_har(bad_file, {"version": "1.2"})
+        with pytest.raises(HarParseError, match="Missing required 'log'"):
+            list(iter_har_file(bad_file))
+
+    def test_entries_not_array(self, tmp_path: Path) -> None:
+        """HarParseError raised when 'entries' is not a list."""
+        bad_file = tmp_path / "bad_entries.har"
+        _write_har(bad_file, {"log": {"entries": {}}})
+        with pytest.raises(HarParseError, match="'entries' must be a JSON array"):
+            list(iter_har_file(bad_file))
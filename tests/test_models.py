@@ -9,8 +9,12 @@ Ref:
 
 from __future__ import annotations
 
-from dataclasses import FrozenInstanceError
+from dataclasses import FrozenInstanceError, asdict, fields
 from datetime import datetime
+from enum import Enum
+from functools import partial
+from types import MappingProxyType
+from typing import Mapping, Set, Type
 
 import pytest
 
@@ -18,75 +22,73 @@ from src.input.models import (
     AnalysisResult,
     AuthMechanism,
     Finding,
+    HeaderDict,
     HttpExchange,
     RiskLevel,
     SessionFlow,
     Severity,
 )
 
+# Minimal GET exchange: no bodies, empty headers and cookies, status 200.
+# Keyword arguments override single fields. The empty mappings are read-only
+# views, so sharing them across exchanges cannot leak state.
+_EMPTY: Mapping[str, str] = MappingProxyType({})
+_make_exchange = partial(
+    HttpExchange,
+    request_method="GET",
+    request_url="https://example.com/",
+    request_headers=_EMPTY,
+    request_cookies=_EMPTY,
+    request_body=None,
+    request_content_type="",
+    response_status=200,
+    response_headers=_EMPTY,
+    response_body=None,
+    timestamp=datetime(2026, 1, 1),
+)
+
 
 # ---------------------------------------------------------------------------
 # Enum Tests
 # ---------------------------------------------------------------------------
 
 
-class TestSeverity:
-    """Tests for the Severity enum."""
-
-    def test_all_members_exist(self) -> None:
-        """Severity has exactly 5 members: CRITICAL, HIGH, MEDIUM, LOW, INFO."""
-        assert len(Severity) == 5
-        expected = {"CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"}
-        assert {s.value for s in Severity} == expected
-
-    def test_string_comparison(self) -> None:
-        """Severity members compare equal to their string values (str mixin)."""
-        assert Severity.HIGH == "HIGH"
-        assert Severity.INFO == "INFO"
-
-    def test_construction_from_string(self) -> None:
-        """Severity can be constructed from a string value."""
-        assert Severity("CRITICAL") is Severity.CRITICAL
-
-    def test_invalid_value_raises(self) -> None:
-        """Invalid string raises ValueError."""
-        with pytest.raises(ValueError):
-            Severity("UNKNOWN")
-
-
-class TestRiskLevel:
-    """Tests for the RiskLevel enum."""
-
-    def test_all_members_exist(self) -> None:
-        """RiskLevel has exactly 4 members: LOW, MEDIUM, HIGH, CRITICAL."""
-        assert len(RiskLevel) == 4
-        expected = {"LOW", "MEDIUM", "HIGH", "CRITICAL"}
-        assert {r.value for r in RiskLevel} == expected
-
-    def test_string_comparison(self) -> None:
-        """RiskLevel members compare equal to their string values."""
-        assert RiskLevel.LOW == "LOW"
-        assert RiskLevel.CRITICAL == "CRITICAL"
+@pytest.mark.parametrize(
+    ("enum_cls", "values"),
+    [
+        (Severity, {"CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"}),
+        (RiskLevel, {"LOW", "MEDIUM", "HIGH", "CRITICAL"}),
+        (AuthMechanism, {"cookie", "header_only", "mixed", "none"}),
+    ],
+    ids=["Severity", "RiskLevel", "AuthMechanism"],
+)
+def test_enum_members(enum_cls: Type[Enum], values: Set[str]) -> None:
+    """Each enum has exactly the expected values and round-trips from them.
 
+    Members compare equal to their string values (str mixin); unknown
+    values raise ValueError.
+    """
+    assert {m.value for m in enum_cls} == values
+    for member in enum_cls:
+        assert enum_cls(member.value) is member
+        assert member == member.value
+    with pytest.raises(ValueError):
+        enum_cls("UNKNOWN")
 
-class TestAuthMechanism:
-    """Tests for the AuthMechanism enum."""
 
-    def test_all_members_exist(self) -> None:
-        """AuthMechanism has exactly 4 members with lowercase values."""
-        assert len(AuthMechanism) == 4
-        expected = {"cookie", "header_only", "mixed", "none"}
-        assert {a.value for a in AuthMechanism} == expected
+# ---------------------------------------------------------------------------
+# Immutability — all dataclasses frozen per coding_standards §2.4
+# ---------------------------------------------------------------------------
 
-    def test_string_comparison(self) -> None:
-        """AuthMechanism members compare equal to their lowercase string values."""
-        assert AuthMechanism.COOKIE == "cookie"
-        assert AuthMechanism.HEADER_ONLY == "header_only"
-        assert AuthMechanism.NONE == "none"
 
-    def test_construction_from_string(self) -> None:
-        """AuthMechanism can be constructed from a lowercase string value."""
-        assert AuthMechanism("header_only") is AuthMechanism.HEADER_ONLY
+@pytest.mark.parametrize(
+    "cls",
+    [HttpExchange, SessionFlow, Finding, AnalysisResult],
+    ids=lambda cls: cls.__name__,
+)
+def test_dataclass_frozen(cls: type) -> None:
+    """Each model's dataclass parameters declare it frozen."""
+    assert cls.__dataclass_params__.frozen  # type: ignore[attr-defined]
 
 
 # ---------------------------------------------------------------------------
@@ -103,61 +105,107 @@ class TestHttpExchange:
         assert sample_exchange.request_url == "https://example.com/profile/update"
         assert sample_exchange.response_status == 200
 
-    def test_frozen_immutability(self, sample_exchange: HttpExchange) -> None:
-        """HttpExchange fields cannot be modified after construction."""
-        with pytest.raises(FrozenInstanceError):
-            sample_exchange.request_method = "GET"  # type: ignore[misc]
-
     def test_optional_body_none(self) -> None:
         """HttpExchange accepts None for optional body fields."""
-        exchange = HttpExchange(
-            request_method="GET",
-            request_url="https://example.com/",
-            request_headers={},
-            request_cookies={},
-            request_body=None,
-            request_content_type="",
-            response_status=200,
-            response_headers={},
-            response_body=None,
-            timestamp=datetime(2026, 1, 1),
-        )
+        exchange = _make_exchange()
         assert exchange.request_body is None
         assert exchange.response_body is None
 
     def test_empty_headers_and_cookies(self) -> None:
         """HttpExchange works with empty header and cookie dicts."""
-        exchange = HttpExchange(
-            request_method="GET",
-            request_url="https://example.com/",
-            request_headers={},
-            request_cookies={},
-            request_body=None,
-            request_content_type="",
-            response_status=200,
-            response_headers={},
-            response_body=None,
-            timestamp=datetime(2026, 1, 1),
-        )
+        exchange = _make_exchange(request_headers={}, request_cookies={})
         assert exchange.request_headers == {}
         assert exchange.request_cookies == {}
 
     def test_equality(self) -> None:
         """Two HttpExchange objects with same data are equal."""
-        ts = datetime(2026, 1, 1)
-        kwargs = dict(
-            request_method="GET",
-            request_url="https://example.com/",
-            request_headers={},
-            request_cookies={},
-            request_body=None,
-            request_content_type="",
-            response_status=200,
-            response_headers={},
-            response_body=None,
-            timestamp=ts,
+        assert _make_exchange() == _make_exchange()
+
+    def test_headers_lc_lowercases_names(self, sample_exchange: HttpExchange) -> None:
+        """headers_lc exposes request headers under lowercased names."""
+        assert sample_exchange.headers_lc == {
+            "content-type": "application/x-www-form-urlencoded",
+        }
+
+    def test_asdict_has_only_declared_fields(self, sample_exchange: HttpExchange) -> None:
+        """asdict() carries the ten declared fields and no internal state."""
+        assert list(asdict(sample_exchange)) == [
+            "request_method",
+            "request_url",
+            "request_headers",
+            "request_cookies",
+            "request_body",
+            "request_content_type",
+            "response_status",
+            "response_headers",
+            "response_body",
+            "timestamp",
+        ]
+
+    def test_uses_slots(self, sample_exchange: HttpExchange) -> None:
+        """Instances are slotted and carry no per-instance __dict__."""
+        assert not hasattr(sample_exchange, "__dict__")
+
+    def test_fast_constructor_matches_init(self, sample_exchange: HttpExchange) -> None:
+        """_make builds an equal, still-frozen instance."""
+        made = HttpExchange._make(  # type: ignore[attr-defined]
+            *(getattr(sample_exchange, f.name) for f in fields(HttpExchange) if f.init)
         )
-        assert HttpExchange(**kwargs) == HttpExchange(**kwargs)
+        assert made == sample_exchange
+        assert made.headers_lc["content-type"] == sample_exchange.headers_lc["content-type"]
+        with pytest.raises(FrozenInstanceError):
+            made.request_method = "GET"  # type: ignore[misc]
+
+
+# ---------------------------------------------------------------------------
+# HeaderDict Tests
+# ---------------------------------------------------------------------------
+
+
+class TestHeaderDict:
+    """Tests for the case-insensitive HeaderDict mapping."""
+
+    def test_lookup_ignores_case(self) -> None:
+        """Lookups and membership work with any casing."""
+        headers = HeaderDict({"Content-Type": "application/json"})
+        assert headers["CONTENT-TYPE"] == "application/json"
+        assert headers.get("content-type") == "application/json"
+        assert "Content-type" in headers
+
+    def test_keys_stored_lowercased(self) -> None:
+        """Iteration yields lowercased names."""
+        headers = HeaderDict([("X-API-Key", "k")])
+        headers["Host"] = "example.com"
+        assert list(headers) == ["x-api-key", "host"]
+
+    def test_merge_operators_lowercase(self) -> None:
+        """|, reflected | and |= all yield lowercased HeaderDicts."""
+        headers = HeaderDict({"A": "1"})
+        merged = headers | {"B": "2"}
+        reflected = {"B": "2"} | headers
+        assert isinstance(merged, HeaderDict) and merged == {"a": "1", "b": "2"}
+        assert isinstance(reflected, HeaderDict) and reflected == {"b": "2", "a": "1"}
+        assert headers == {"a": "1"}
+        headers |= {"Foo": "3"}
+        assert isinstance(headers, HeaderDict)
+        assert "foo" in headers and list(headers) == ["a", "foo"]
+
+    def test_fromkeys_lowercases(self) -> None:
+        """fromkeys() builds a HeaderDict with lowercased names."""
+        headers = HeaderDict.fromkeys(["X-A", "Host"], "")
+        assert isinstance(headers, HeaderDict)
+        assert headers == {"x-a": "", "host": ""}
+
+    def test_from_pairs_joins_repeats(self) -> None:
+        """from_pairs() lowercases names and joins repeats in order."""
+        headers = HeaderDict.from_pairs([("Via", "a"), ("Host", "h"), ("VIA", "b")])
+        assert headers == {"via": "a, b", "host": "h"}
+
+    def test_headers_lc_reuses_header_dict(self) -> None:
+        """HttpExchange.headers_lc returns a HeaderDict as-is."""
+        headers = HeaderDict({"Authorization": "Bearer x"})
+        exchange = _make_exchange(request_headers=headers)
+        assert exchange.headers_lc is headers
 
 
 # ---------------------------------------------------------------------------
@@ -174,11 +222,6 @@ class TestSessionFlow:
         assert sample_session_flow.auth_mechanism == AuthMechanism.COOKIE
         assert len(sample_session_flow.exchanges) == 1
 
-    def test_frozen_immutability(self, sample_session_flow: SessionFlow) -> None:
-        """SessionFlow fields cannot be modified after construction."""
-        with pytest.raises(FrozenInstanceError):
-            sample_session_flow.session_id = "hacked"  # type: ignore[misc]
-
     def test_auth_mechanism_is_enum(self, sample_session_flow: SessionFlow) -> None:
         """auth_mechanism field is an AuthMechanism enum instance."""
         assert isinstance(sample_session_flow.auth_mechanism, AuthMechanism)
@@ -188,6 +231,15 @@ class TestSessionFlow:
         assert bearer_session_flow.auth_mechanism == AuthMechanism.HEADER_ONLY
         assert bearer_session_flow.auth_mechanism == "header_only"
 
+    def test_fast_constructor_matches_init(self, sample_session_flow: SessionFlow) -> None:
+        """_make builds an equal, still-frozen flow."""
+        made = SessionFlow._make(  # type: ignore[attr-defined]
+            *(getattr(sample_session_flow, f.name) for f in fields(SessionFlow))
+        )
+        assert made == sample_session_flow
+        with pytest.raises(FrozenInstanceError):
+            made.session_id = "other"  # type: ignore[misc]
+
 
 # ---------------------------------------------------------------------------
 # Finding Tests
@@ -211,19 +263,6 @@ class TestFinding:
         assert finding.severity == Severity.HIGH
         assert finding.severity == "HIGH"
 
-    def test_frozen_immutability(self, sample_exchange: HttpExchange) -> None:
-        """Finding fields cannot be modified after construction."""
-        finding = Finding(
-            rule_id="CSRF-001",
-            rule_name="Missing CSRF Token in Form",
-            severity=Severity.HIGH,
-            description="Test",
-            evidence="Test",
-            exchange=sample_exchange,
-        )
-        with pytest.raises(FrozenInstanceError):
-            finding.severity = Severity.LOW  # type: ignore[misc]
-
     def test_info_severity_for_csrf_011(self, bearer_exchange: HttpExchange) -> None:
         """CSRF-011 finding uses INFO severity (short-circuit)."""
         finding = Finding(
@@ -299,19 +338,6 @@ class TestAnalysisResult:
         assert result.ml_probability is None
         assert result.feature_vector is None
 
-    def test_frozen_immutability(self, sample_exchange: HttpExchange) -> None:
-        """AnalysisResult fields cannot be modified after construction."""
-        result = AnalysisResult(
-            endpoint="/test",
-            http_method="GET",
-            risk_score=10,
-            risk_level=RiskLevel.LOW,
-            findings=[],
-            recommendations=[],
-        )
-        with pytest.raises(FrozenInstanceError):
-            result.risk_score = 99  # type: ignore[misc]
-
     def test_empty_findings_and_recommendations(self) -> None:
         """AnalysisResult works with empty lists."""
         result = AnalysisResult(